@@ -17,26 +17,42 @@ For production, use a WSGI server with wsgi.py:
 
 import os
 import time
+import importlib
 from pathlib import Path
 from flask import Flask
 from dotenv import load_dotenv
 from config_loader import get_config
 from utils.logging_setup import setup_flask_logging
 from utils.directory_setup import ensure_directories
-from routes.upload_routes import upload_bp
-from routes.job_routes import job_bp
-from routes.file_routes import file_bp
-from routes.config_routes import config_bp
-from routes.health_routes import health_bp
-
-# Load environment variables
-load_dotenv()
+from utils.access_log import AccessLogMiddleware
+
+# Blueprints as (module, attribute) pairs; imported inside create_app() so that
+# importing this module does not pull in every route module and its dependencies
+BLUEPRINTS = [
+    ('routes.upload_routes', 'upload_bp'),
+    ('routes.job_routes', 'job_bp'),
+    ('routes.file_routes', 'file_bp'),
+    ('routes.config_routes', 'config_bp'),
+    ('routes.health_routes', 'health_bp'),
+]
+
+# Load environment variables from .env unless the deployment already provides
+# them (e.g. docker-compose sets SKIP_DOTENV=1); must run before get_config()
+if os.environ.get('SKIP_DOTENV') != '1':
+    load_dotenv()
 
 # Initialize configuration
 config = get_config()
 
-# Get project root directory (parent of src/)
-project_root = Path(__file__).parent.parent
+# Request paths excluded from access logging (health checks)
+_LOG_SKIP_PREFIXES = ('/health', '/ready')
+
+# Get project root directory (parent of src/), resolved once to an absolute path
+project_root = Path(__file__).resolve().parent.parent
+
+# Template and static folders as strings, computed once rather than per create_app()
+_TEMPLATE_FOLDER = str(project_root / 'templates')
+_STATIC_FOLDER = str(project_root / 'static')
 
 def create_app():
     """Create and configure the Flask application instance.
@@ -54,20 +70,22 @@ def create_app():
     """
     # Initialize Flask app with correct template and static paths
     app = Flask(__name__, 
-               template_folder=str(project_root / 'templates'),
-               static_folder=str(project_root / 'static'))
-
-    # Configure app
-    app.config['SECRET_KEY'] = config.get_secret_key()
-    app.config['UPLOAD_FOLDER'] = config.get_upload_folder()
-    app.config['JOB_RESULTS_FOLDER'] = config.get('files.job_results_folder', 'job_results')
-    app.config['MAX_CONTENT_LENGTH'] = config.get_max_file_size_bytes()
-    app.config['ALLOWED_EXTENSIONS'] = config.get_allowed_extensions()
-    app.config['CACHE_FOLDER'] = config.get('cache.directory', '.cache')
-    app.config['LOGS_FOLDER'] = config.get('files.logs_folder', 'logs')
-    
-    # Track application start time for health checks
-    app.config['START_TIME'] = time.time()
+               template_folder=_TEMPLATE_FOLDER,
+               static_folder=_STATIC_FOLDER)
+
+    # Configure app in one pass, reading straight from the loaded config sections
+    file_config = config.file_config
+    app.config.update({
+        'SECRET_KEY': config.get_secret_key(),
+        'UPLOAD_FOLDER': config.get_upload_folder(),
+        'JOB_RESULTS_FOLDER': file_config.get('job_results_folder', 'job_results'),
+        'MAX_CONTENT_LENGTH': config.get_max_file_size_bytes(),
+        'ALLOWED_EXTENSIONS': config.get_allowed_extensions(),
+        'CACHE_FOLDER': config.cache_config.get('directory', '.cache'),
+        'LOGS_FOLDER': file_config.get('logs_folder', 'logs'),
+        # Track application start time for health checks
+        'START_TIME': time.time(),
+    })
     
     # Production security settings
     if os.environ.get('FLASK_ENV') == 'production':
@@ -82,44 +100,13 @@ def create_app():
     # Setup logging
     logger = setup_flask_logging(app)
 
-    # Register request/response logging
-    @app.before_request
-    def log_request_info():
-        """Log incoming HTTP requests.
-        
-        Logs request method, URL, and remote IP address for all requests
-        except health check endpoints to reduce log noise.
-        """
-        from flask import request
-        # Skip logging for health check endpoints to reduce noise
-        if not request.path.startswith('/health') and not request.path.startswith('/ready'):
-            logger.info(f"Request: {request.method} {request.url} - Remote IP: {request.remote_addr}")
-
-    @app.after_request
-    def log_response_info(response):
-        """Log HTTP response information.
-        
-        Logs response status code for all requests except health check
-        endpoints to reduce log noise.
-        
-        Args:
-            response (Response): Flask response object.
-            
-        Returns:
-            Response: The unmodified response object.
-        """
-        from flask import request
-        # Skip logging for health check endpoints to reduce noise
-        if not request.path.startswith('/health') and not request.path.startswith('/ready'):
-            logger.info(f"Response: {response.status_code} for {request.method} {request.url}")
-        return response
+    # Register request/response logging as WSGI middleware
+    app.wsgi_app = AccessLogMiddleware(app.wsgi_app, logger, _LOG_SKIP_PREFIXES)
 
     # Register blueprints
-    app.register_blueprint(upload_bp)
-    app.register_blueprint(job_bp)
-    app.register_blueprint(file_bp)
-    app.register_blueprint(config_bp)
-    app.register_blueprint(health_bp)
+    for module_name, blueprint_name in BLUEPRINTS:
+        module = importlib.import_module(module_name)
+        app.register_blueprint(getattr(module, blueprint_name))
 
     # Error handlers
     @app.errorhandler(413)
@@ -167,11 +154,10 @@ def create_app():
 
     return app
 
-# Create the app instance
-app = create_app()
-
 if __name__ == '__main__':
-    # Development server
+    # Development server; WSGI servers get their instance from wsgi.py, so
+    # importing this module never builds an app
+    app = create_app()
     debug_mode = config.get('flask.debug', False)
     port = config.get('flask.port', 5000)
     host = config.get('flask.host', '127.0.0.1')
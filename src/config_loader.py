@@ -1,14 +1,42 @@
 import os
-import yaml
+import json
 import logging
+import mmap
 import re
+import shutil
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple, Union
 
 
+@lru_cache(maxsize=1)
+def _yaml_backend():
+    """Import PyYAML on first use.
+    
+    Loads served from the JSON sidecar never need YAML, so the import (and the
+    libyaml bindings) is deferred until a YAML file is parsed or written.
+    
+    Returns:
+        tuple: ``(yaml, Loader, Dumper)``, preferring the libyaml-backed loader
+            and dumper and falling back to the pure-Python ones if unavailable.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+@lru_cache(maxsize=1)
 def _get_project_root():
     """Get the project root directory.
     
+    The result is computed once and cached.
+    
     Returns:
         Path: The project root directory path (parent of src/).
     """
@@ -18,7 +46,43 @@ def _get_project_root():
     return current_dir.parent
 
 
-def _substitute_env_vars(value):
+@lru_cache(maxsize=1)
+def _get_default_config_path():
+    """Get the default configuration file path (cached).
+    
+    Returns:
+        Path: config/config.yaml relative to the project root.
+    """
+    return _get_project_root() / "config" / "config.yaml"
+
+
+# Pattern to match ${VAR:-default} or ${VAR} or $VAR
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+
+
+def _resolve_braced_var(var_expr, env):
+    """Return the value for the inside of a ``${...}`` reference."""
+    if ':-' in var_expr:
+        # Handle ${VAR:-default} syntax
+        var_name, default_value = var_expr.split(':-', 1)
+        return env.get(var_name.strip(), default_value)
+    else:
+        # Handle ${VAR} syntax
+        var_name = var_expr.strip()
+        return env.get(var_name, '')
+
+
+def _replace_env_match(match, env):
+    """Return the environment value for one ``_ENV_VAR_RE`` match."""
+    if match.group(1):  # ${...} format
+        return _resolve_braced_var(match.group(1), env)
+    elif match.group(2):  # $VAR format
+        var_name = match.group(2)
+        return env.get(var_name, '')
+    return match.group(0)
+
+
+def _substitute_env_vars(value, env=None):
     """Substitute environment variables in a string value.
     
     Supports ${VAR:-default}, ${VAR}, and $VAR syntax for environment variable
@@ -26,53 +90,167 @@ def _substitute_env_vars(value):
     
     Args:
         value: The value to process. If not a string, returns unchanged.
+        env (Mapping, optional): Environment to read variables from, typically
+            a plain-dict snapshot of os.environ (much cheaper to query than
+            os.environ itself). Defaults to os.environ.
         
     Returns:
         The value with environment variables substituted, or original value
         if not a string.
     """
-    if not isinstance(value, str):
+    # Most values reference no variables; skip the regex engine entirely
+    if not isinstance(value, str) or '$' not in value:
         return value
     
-    # Pattern to match ${VAR:-default} or ${VAR} or $VAR
-    pattern = r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)'
+    if env is None:
+        env = os.environ
     
-    def replace_match(match):
-        if match.group(1):  # ${...} format
-            var_expr = match.group(1)
-            if ':-' in var_expr:
-                # Handle ${VAR:-default} syntax
-                var_name, default_value = var_expr.split(':-', 1)
-                return os.environ.get(var_name.strip(), default_value)
-            else:
-                # Handle ${VAR} syntax
-                var_name = var_expr.strip()
-                return os.environ.get(var_name, '')
-        elif match.group(2):  # $VAR format
-            var_name = match.group(2)
-            return os.environ.get(var_name, '')
-        return match.group(0)
+    # Whole value is a single ${...} reference (e.g. "${REDIS_URL:-...}"):
+    # resolve it directly instead of running the regex substitution
+    if (len(value) > 3 and value.startswith('${') and value.find('}') == len(value) - 1
+            and value.count('$') == 1):
+        return _resolve_braced_var(value[2:-1], env)
     
-    return re.sub(pattern, replace_match, value)
+    return _ENV_VAR_RE.sub(lambda match: _replace_env_match(match, env), value)
 
 
-def _process_config_recursively(config_data):
-    """Recursively process configuration data to substitute environment variables.
+# How to iterate (key, value) entries of each container type the walker descends into
+_ENTRY_ITERATORS = {dict: dict.items, list: enumerate}
+
+
+def _process_config_env_vars(config_data, env=None):
+    """Substitute environment variables throughout parsed configuration data.
+    
+    Walks the tree iteratively with an explicit stack of containers instead of
+    recursing (constant Python stack depth), and updates dicts and lists in
+    place (only strings containing '$' are substituted, and only changed
+    strings are reassigned), so loading keeps a single tree in memory. Nodes
+    are dispatched on their exact type, which is all the YAML/JSON loaders
+    produce.
     
     Args:
         config_data: The configuration data to process (dict, list, or scalar).
+        env (Mapping, optional): Environment snapshot used for the whole pass.
+            Defaults to a fresh ``dict(os.environ)``.
         
     Returns:
-        The processed configuration data with environment variables substituted.
+        The processed configuration data with environment variables substituted;
+        the same object for dicts and lists.
     """
-    if isinstance(config_data, dict):
-        return {key: _process_config_recursively(value) for key, value in config_data.items()}
-    elif isinstance(config_data, list):
-        return [_process_config_recursively(item) for item in config_data]
-    elif isinstance(config_data, str):
-        return _substitute_env_vars(config_data)
-    else:
-        return config_data
+    if env is None:
+        env = dict(os.environ)
+    if type(config_data) not in _ENTRY_ITERATORS:
+        return _substitute_env_vars(config_data, env)
+    
+    entry_iterators = _ENTRY_ITERATORS
+    pending = [config_data]
+    while pending:
+        container = pending.pop()
+        for key, value in entry_iterators[type(container)](container):
+            value_type = type(value)
+            if value_type in entry_iterators:
+                pending.append(value)
+            elif value_type is str and '$' in value:
+                new_value = _substitute_env_vars(value, env)
+                if new_value is not value:
+                    # Replacing the value of an existing key/index is safe during iteration
+                    container[key] = new_value
+    return config_data
+
+
+# Config files at least this large are memory-mapped for parsing
+_MMAP_MIN_SIZE = 16 * 1024
+
+# Format of the config.yaml.cache.json sidecar; bump to ignore sidecars written
+# by older code (version 2: only trees that round-trip through JSON are cached)
+_CONFIG_CACHE_VERSION = 2
+
+# String config values up to this length are interned when indexed; long
+# enough for substituted hostnames and URLs, not for prompt-sized text
+_INTERN_MAX_LENGTH = 128
+
+
+def _flatten_config(config_data: Dict) -> Dict[str, Any]:
+    """Index every node of a nested configuration by its dot-separated path.
+    
+    Both leaves and intermediate dicts are included, e.g. ``{'a': {'b': 1}}``
+    yields ``{'a': {'b': 1}, 'a.b': 1}``. Only string keys without a '.' are
+    indexed, matching what a dotted path can address. The tree is walked with
+    an explicit stack rather than recursion. Paths and short string
+    values (written back into the tree) are interned so repeated strings such
+    as model names share one object. This runs on the already substituted
+    tree, so values produced by env var substitution are interned as well.
+    
+    Args:
+        config_data (Dict): The nested configuration.
+        
+    Returns:
+        Dict[str, Any]: Mapping of dotted key paths to values.
+    """
+    flat = {}
+    # Explicit (node, prefix) stack instead of recursion; prefix is '' or 'a.b.'
+    pending = [(config_data, '')]
+    while pending:
+        node, prefix = pending.pop()
+        for key, value in node.items():
+            if type(key) is not str or '.' in key:
+                continue
+            path = sys.intern(prefix + key)
+            value_type = type(value)
+            if value_type is str and len(value) <= _INTERN_MAX_LENGTH:
+                # Replacing the value of an existing key is safe during iteration
+                value = node[key] = sys.intern(value)
+            flat[path] = value
+            if value_type is dict:
+                pending.append((value, path + '.'))
+    return flat
+
+
+# Sentinel for "key not present", distinct from a stored None
+_MISSING = object()
+
+@lru_cache(maxsize=512)
+def _split_key_path(key_path: str) -> tuple:
+    """Split a dot-separated key path into its components (LRU-cached).
+    
+    Args:
+        key_path (str): Dot-separated path (e.g., 'app.debug').
+        
+    Returns:
+        tuple: The path components, shared between calls for the same path.
+    """
+    return tuple(key_path.split('.'))
+
+
+# Boolean spellings recognised in environment variable values (lowercased)
+_BOOL_MAP = {
+    'true': True, 'yes': True, '1': True, 'on': True,
+    'false': False, 'no': False, '0': False, 'off': False,
+}
+
+
+# Section attributes exposed by ConfigLoader, mapped to their top-level config key
+_SECTION_MAP = {
+    'app_config': 'app',
+    'file_config': 'files',
+    'logging_config': 'logging',
+    'openai_config': 'openai',
+    'cache_config': 'cache',
+    'job_search_config': 'job_search',
+    'resume_processing_config': 'resume_processing',
+    'cleanup_config': 'cleanup',
+    'ui_config': 'ui',
+    'development_config': 'development',
+    'security_config': 'security',
+    'job_analysis_config': 'job_analysis',
+}
+
+# Values precomputed by ConfigLoader._refresh_derived() for the getter methods
+_PRECOMPUTED_SLOTS = (
+    '_upload_folder', '_max_file_size_bytes', '_allowed_extensions',
+    '_professional_domains', '_job_search_sites', '_cache_directory',
+    '_openai_model',
+)
 
 
 class ConfigLoader:
@@ -80,8 +258,41 @@ class ConfigLoader:
     
     Loads configuration from YAML file with environment variable overrides
     and provides convenient access methods for configuration values.
+    
+    Attributes:
+        config_file (Path): Path to the YAML configuration file.
+        app_config (Dict): Application configuration section.
+        file_config (Dict): File management configuration section.
+        logging_config (Dict): Logging configuration section.
+        openai_config (Dict): OpenAI configuration section.
+        cache_config (Dict): Cache configuration section.
+        job_search_config (Dict): Job search configuration section.
+        resume_processing_config (Dict): Resume processing configuration section.
+        cleanup_config (Dict): Cleanup configuration section.
+        ui_config (Dict): UI configuration section.
+        development_config (Dict): Development configuration section.
+        security_config (Dict): Security configuration section.
+        job_analysis_config (Dict): Job analysis configuration section.
+    
+    The YAML file is parsed lazily, on first access to the configuration
+    (``get()``, a section attribute, ...), so a missing or invalid file is
+    reported then rather than at construction. The section attributes are
+    resolved once per load (and after ``set()``) instead of on every access.
+    Environment overrides are read from a
+    snapshot of ``os.environ`` taken at construction; call ``refresh_env()``
+    (or ``reload()``) after changing the environment at runtime.
     """
     
+    # Fixed attribute set: no per-instance __dict__ and faster attribute reads
+    __slots__ = (
+        ('config_file', '_hot', '_stat_key', '_dirty', '_env_raw', '_env_cache', '_load_lock',
+         '_config', '_config_view', '_flat') + tuple(_SECTION_MAP) + _PRECOMPUTED_SLOTS
+    )
+    
+    # Slots populated by _load_config(); reading one before the first load triggers it
+    _LOADED_SLOTS = frozenset(
+        ('_config', '_config_view', '_flat') + tuple(_SECTION_MAP) + _PRECOMPUTED_SLOTS)
+    
     def __init__(self, config_file: str = None):
         """Initialize the configuration loader.
         
@@ -91,59 +302,257 @@ class ConfigLoader:
         """
         if config_file is None:
             # Default to config/config.yaml relative to project root
-            project_root = _get_project_root()
-            config_file = project_root / "config" / "config.yaml"
+            self.config_file = _get_default_config_path()
+        else:
+            self.config_file = Path(config_file)
+        # Single-slot (key_path, value) memo for the most recent lookup; kept as
+        # one tuple so readers always see a consistent pair
+        self._hot = (_MISSING, None)
+        # YAML (st_mtime_ns, st_size) at the last load, and whether set()
+        # changed values since
+        self._stat_key = None
+        self._dirty = False
+        # Serializes loads (lazy first load and reload()) across threads
+        self._load_lock = threading.RLock()
+        self.refresh_env()
+    
+    def __getattr__(self, name: str) -> Any:
+        """Load the configuration on first access to a loaded attribute.
+        
+        Only called when normal lookup fails, i.e. for slots not yet assigned,
+        so it adds no cost once the configuration is loaded.
+        
+        Args:
+            name (str): The attribute being accessed.
+            
+        Returns:
+            Any: The attribute value after loading the configuration.
+            
+        Raises:
+            AttributeError: If ``name`` is not populated by loading.
+            FileNotFoundError, ValueError, RuntimeError: As raised by ``_load_config()``.
+        """
+        if name not in ConfigLoader._LOADED_SLOTS or self._stat_key is not None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        with self._load_lock:
+            # Another thread may have completed the first load while we waited
+            if self._stat_key is None:
+                self._load_config()
+        return object.__getattribute__(self, name)
+    
+    def refresh_env(self) -> None:
+        """Re-snapshot environment variables used for overrides.
         
-        self.config_file = Path(config_file)
-        self._config = {}
-        self._load_config()
+        Environment variables rarely change while the application runs, so
+        ``get()`` and ``get_list()`` consult a snapshot of ``os.environ``
+        (raw and type-converted) instead of the live process environment.
+        """
+        self._env_raw = dict(os.environ)
+        self._env_cache = {name: self._convert_env_value(value)
+                           for name, value in self._env_raw.items()}
     
     def _load_config(self) -> None:
         """Load configuration from YAML file.
         
+        The new tree and its index are built completely before being assigned,
+        so concurrent readers see either the previous configuration or the new
+        one, never a partially processed tree. Callers should hold
+        ``_load_lock``.
+        
         Raises:
             FileNotFoundError: If the configuration file does not exist.
             ValueError: If the YAML file contains invalid syntax.
             RuntimeError: If the configuration fails to load for other reasons.
         """
-        if not self.config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
+        # One stat doubles as the existence check; taken before reading so a
+        # write racing with the load triggers another reload
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_file}") from None
+        stat_key = (st.st_mtime_ns, st.st_size)
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                raw_config = yaml.safe_load(f) or {}
+            raw_config, has_env_refs = self._read_raw_config(stat_key)
             
-            # Process environment variable substitution
-            self._config = _process_config_recursively(raw_config)
+            # Process environment variable substitution; without any '$' in the
+            # source there is nothing to substitute, so use the parsed tree as is
+            if has_env_refs:
+                config = _process_config_env_vars(raw_config, self._env_raw)
+            else:
+                config = raw_config
+            flat = _flatten_config(config)
+            
+            # Publish the fully built tree and index
+            self._config = config
+            self._config_view = MappingProxyType(config)
+            self._flat = flat
+            self._hot = (_MISSING, None)
+            self._refresh_derived()
+            self._stat_key = stat_key
+            self._dirty = False
             
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML configuration file: {e}")
         except Exception as e:
+            # yaml is imported lazily; if it was never imported this can't be a YAMLError
+            yaml = sys.modules.get('yaml')
+            if yaml is not None and isinstance(e, yaml.YAMLError):
+                raise ValueError(f"Invalid YAML configuration file: {e}")
             raise RuntimeError(f"Failed to load configuration: {e}")
     
+    def _reindex(self) -> None:
+        """Rebuild the flat ``get()`` index after the configuration changes."""
+        self._flat = _flatten_config(self._config)
+        self._hot = (_MISSING, None)
+    
+    def _refresh_derived(self) -> None:
+        """Recompute section attributes and precomputed values from the current config.
+        
+        Must be called whenever ``self._config`` is replaced or mutated.
+        """
+        config = self._config
+        for attr_name, section in _SECTION_MAP.items():
+            setattr(self, attr_name, config.get(section, {}))
+        
+        self._upload_folder = self.get('files.upload_folder', 'uploads')
+        self._max_file_size_bytes = self.get('files.max_file_size_mb', 16) * 1024 * 1024
+        self._cache_directory = self.get('cache.directory', '.cache')
+        self._openai_model = self.get('openai.model', 'gpt-3.5-turbo')
+        # Immutable so every caller can safely share the same object
+        self._allowed_extensions = frozenset(
+            self.get_list('files.allowed_extensions', ['txt', 'pdf', 'docx', 'doc']))
+        self._professional_domains = frozenset(
+            self.get_list('resume_processing.pii_removal.professional_domains',
+                          ['github.com', 'linkedin.com', 'stackoverflow.com']))
+        self._job_search_sites = tuple(
+            self.get_list('job_search.default_sites', ['indeed', 'linkedin']))
+    
+    def _read_raw_config(self, stat_key: Tuple[int, int]) -> Tuple[Dict, bool]:
+        """Read the parsed YAML before environment variable substitution.
+        
+        A JSON sidecar (config.yaml.cache.json) holding the parsed YAML is reused
+        when it was written in the current sidecar format for the YAML file's
+        current mtime and size, since JSON decoding is much cheaper than YAML
+        parsing. The sidecar stores the raw values so env vars are still
+        substituted on every load. It is
+        written to a temporary file and renamed into place, so concurrent
+        processes never read a partial sidecar. Trees that JSON cannot represent
+        exactly (e.g. non-string keys, which JSON turns into strings) are not
+        cached, so a warm load always returns the same data as a cold one.
+        Failures to read or write the sidecar are ignored and fall back to
+        parsing the YAML.
+        
+        Args:
+            stat_key (Tuple[int, int]): The YAML file's ``(st_mtime_ns, st_size)``,
+                already obtained by the caller.
+        
+        Returns:
+            Tuple[Dict, bool]: The raw configuration data, and whether the source
+                text contains any '$' (i.e. may need env var substitution).
+        """
+        cache_file = self.config_file.with_suffix('.yaml.cache.json')
+        try:
+            cached_bytes = cache_file.read_bytes()
+            cached = json.loads(cached_bytes)
+            if (cached.get('version') == _CONFIG_CACHE_VERSION
+                    and cached['stat_key'] == list(stat_key)):
+                # JSON never escapes '$', so the check is as exact as on the YAML
+                return cached['config'], b'$' in cached_bytes
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        raw_config, has_env_refs = self._parse_yaml_file()
+        
+        # Per-process temp name so concurrent writers don't share a file
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            serialized = json.dumps({'version': _CONFIG_CACHE_VERSION,
+                                     'stat_key': list(stat_key), 'config': raw_config})
+            if json.loads(serialized)['config'] != raw_config:
+                logging.debug(f"Config does not round-trip through JSON; not caching {cache_file}")
+                return raw_config, has_env_refs
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(serialized)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            logging.debug(f"Could not write config cache {cache_file}: {e}")
+        
+        return raw_config, has_env_refs
+    
+    def _parse_yaml_file(self) -> Tuple[Dict, bool]:
+        """Parse the YAML file, memory-mapping it when it is large.
+        
+        Files of at least ``_MMAP_MIN_SIZE`` bytes are mapped read-only and the
+        mapping is handed to the loader, so the whole file is never copied into
+        one Python bytes object; smaller files are read in a single call, where
+        mapping setup would cost more than it saves.
+        
+        Returns:
+            Tuple[Dict, bool]: The parsed data, and whether the file contains '$'.
+        """
+        yaml, loader, _ = _yaml_backend()
+        with open(self.config_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                raw_bytes = f.read()
+                return yaml.load(raw_bytes, Loader=loader) or {}, b'$' in raw_bytes
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                # find() defaults to the current position; search from the start
+                has_env_refs = mapped.find(b'$', 0) != -1
+                return yaml.load(mapped, Loader=loader) or {}, has_env_refs
+    
     def save_config(self) -> None:
         """Save current configuration to YAML file.
         
-        Creates a backup of the existing configuration file before saving.
+        Creates a backup of the existing configuration file before saving. The
+        backup is a hard link to the current file where possible (a copy
+        otherwise), and the new content is written to a temporary file that
+        atomically replaces the original, so the backup keeps the old content
+        and readers never see a partially written file. The temporary file is
+        removed if the save fails.
         
         Raises:
             RuntimeError: If the configuration fails to save.
         """
+        tmp_file = self.config_file.with_suffix('.yaml.tmp')
         try:
             # Create backup of current config
             backup_file = self.config_file.with_suffix('.yaml.backup')
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as src:
-                    with open(backup_file, 'w', encoding='utf-8') as dst:
-                        dst.write(src.read())
+            has_original = self.config_file.exists()
+            if has_original:
+                try:
+                    backup_file.unlink()
+                except FileNotFoundError:
+                    pass
+                try:
+                    os.link(self.config_file, backup_file)
+                except OSError:
+                    # Hard links unsupported (e.g. some filesystems); copy instead
+                    # (copyfile uses kernel-side copying where available)
+                    shutil.copyfile(self.config_file, backup_file)
             
-            # Save current configuration
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self._config, f, default_flow_style=False, indent=2, sort_keys=False)
+            # Save current configuration to a temp file, then swap it in
+            yaml, _, dumper = _yaml_backend()
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                yaml.dump(self._config, f, Dumper=dumper, default_flow_style=False,
+                          indent=2, sort_keys=False)
+            if has_original:
+                shutil.copymode(self.config_file, tmp_file)
+            os.replace(tmp_file, self.config_file)
                 
             logging.info(f"Configuration saved to {self.config_file}")
             
         except Exception as e:
+            # Don't leave a half-written temp file behind
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             raise RuntimeError(f"Failed to save configuration: {e}")
     
     def set(self, key_path: str, value: Any) -> None:
@@ -155,7 +564,20 @@ class ConfigLoader:
             key_path (str): Dot-separated path to configuration value (e.g., 'app.debug').
             value (Any): Value to set.
         """
-        keys = key_path.split('.')
+        self._set_no_invalidate(key_path, value)
+        self._reindex()
+        self._refresh_derived()
+    
+    def _set_no_invalidate(self, key_path: str, value: Any) -> None:
+        """Assign a value in the nested config without rebuilding derived state.
+        
+        Callers must call ``_reindex()`` and ``_refresh_derived()`` afterwards.
+        
+        Args:
+            key_path (str): Dot-separated path to configuration value.
+            value (Any): Value to set.
+        """
+        keys = _split_key_path(key_path)
         current = self._config
         
         # Navigate to the parent of the final key
@@ -166,25 +588,32 @@ class ConfigLoader:
                 current[key] = {}
             current = current[key]
         
-        # Set the final value
-        current[keys[-1]] = value
+        # Set the final value (interned key, shared with load-time keys)
+        current[sys.intern(keys[-1])] = value
+        self._dirty = True
     
     def update_multiple(self, updates: Dict[str, Any]) -> None:
         """Update multiple configuration values at once.
         
+        All values are assigned first; the lookup index and derived values are
+        then rebuilt once rather than after every key.
+        
         Args:
             updates (Dict[str, Any]): Dictionary mapping key paths to new values.
         """
         for key_path, value in updates.items():
-            self.set(key_path, value)
+            self._set_no_invalidate(key_path, value)
+        self._reindex()
+        self._refresh_derived()
     
-    def get_all_config(self) -> Dict:
+    def get_all_config(self) -> MappingProxyType:
         """Get the complete configuration dictionary.
         
         Returns:
-            Dict: A copy of the complete configuration dictionary.
+            MappingProxyType: A read-only live view of the configuration; wrap it
+                in ``dict()`` where a real dict is needed (e.g. JSON serialization).
         """
-        return self._config.copy()
+        return self._config_view
     
     def get_config_sections(self) -> List[str]:
         """Get list of top-level configuration sections.
@@ -207,22 +636,23 @@ class ConfigLoader:
         Returns:
             Any: Configuration value, environment override, or default value.
         """
-        # Check environment variable override first
-        if env_override and env_override in os.environ:
-            env_value = os.environ[env_override]
-            # Try to convert to appropriate type
-            return self._convert_env_value(env_value)
-        
-        # Navigate through nested configuration
-        current = self._config
-        keys = key_path.split('.')
-        
-        try:
-            for key in keys:
-                current = current[key]
-            return current
-        except (KeyError, TypeError):
+        # Check environment variable override first (pre-converted snapshot)
+        if env_override:
+            env_value = self._env_cache.get(env_override, _MISSING)
+            if env_value is not _MISSING:
+                return env_value
+        
+        # Repeated reads of the same key (same string object) skip the dict probe
+        hot = self._hot
+        if hot[0] is key_path:
+            return hot[1]
+        
+        # One lookup in the dot-keyed index instead of walking the nested dicts
+        value = self._flat.get(key_path, _MISSING)
+        if value is _MISSING:
             return default
+        self._hot = (key_path, value)
+        return value
     
     def _convert_env_value(self, value: str) -> Union[str, int, float, bool]:
         """Convert environment variable string to appropriate type.
@@ -236,19 +666,27 @@ class ConfigLoader:
             Union[str, int, float, bool]: The converted value.
         """
         # Boolean conversion
-        if value.lower() in ('true', 'yes', '1', 'on'):
-            return True
-        elif value.lower() in ('false', 'no', '0', 'off'):
-            return False
-        
-        # Number conversion
-        try:
-            if '.' in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            pass
+        flag = _BOOL_MAP.get(value.lower())
+        if flag is not None:
+            return flag
+        
+        # Number conversion; only attempted when the value can start a number,
+        # so ordinary strings don't pay for a raised ValueError
+        head = value.lstrip()[:1]
+        if head.isdigit() or (head and head in '+-.'):
+            try:
+                # Plain (optionally negative) integers, the common numeric case,
+                # convert without scanning for '.'; int() can still raise here,
+                # e.g. past the interpreter's integer string length limit
+                digits = value[1:] if value[:1] == '-' else value
+                if digits.isdecimal():
+                    return int(value)
+                if '.' in value:
+                    return float(value)
+                else:
+                    return int(value)
+            except ValueError:
+                pass
         
         # Return as string
         return value
@@ -266,9 +704,10 @@ class ConfigLoader:
         Returns:
             List: Configuration list value or default.
         """
-        if env_override and env_override in os.environ:
-            env_value = os.environ[env_override]
-            return [item.strip() for item in env_value.split(',') if item.strip()]
+        if env_override:
+            env_value = self._env_raw.get(env_override)
+            if env_value is not None:
+                return [item.strip() for item in env_value.split(',') if item.strip()]
         
         return self.get(key_path, default or [])
     
@@ -287,9 +726,27 @@ class ConfigLoader:
     def reload(self) -> None:
         """Reload configuration from file.
         
-        Re-reads and processes the configuration file, updating the internal state.
+        Re-reads and processes the configuration file, updating the internal state,
+        and refreshes the environment variable snapshot. This is a no-op when the
+        file's mtime and size, the environment and the in-memory values are all
+        unchanged since the last load; unsaved ``set()`` changes are always
+        discarded.
         """
-        self._load_config()
+        with self._load_lock:
+            try:
+                st = self.config_file.stat()
+                stat_key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stat_key = None
+            
+            # The size catches same-timestamp rewrites on coarse-mtime filesystems
+            if (not self._dirty and stat_key is not None and stat_key == self._stat_key
+                    and dict(os.environ) == self._env_raw):
+                return
+            
+            # Snapshot first: the load substitutes variables from the snapshot
+            self.refresh_env()
+            self._load_config()
     
     def validate_required_keys(self, required_keys: List[str]) -> List[str]:
         """Validate that required configuration keys exist.
@@ -300,112 +757,8 @@ class ConfigLoader:
         Returns:
             List[str]: List of missing key paths.
         """
-        missing_keys = []
-        for key in required_keys:
-            if self.get(key) is None:
-                missing_keys.append(key)
-        return missing_keys
-    
-    # Convenience methods for common configuration access patterns
-    
-    @property
-    def app_config(self) -> Dict:
-        """Get application configuration.
-        
-        Returns:
-            Dict: Application configuration section.
-        """
-        return self.get_dict('app')
-    
-    @property
-    def file_config(self) -> Dict:
-        """Get file management configuration.
-        
-        Returns:
-            Dict: File management configuration section.
-        """
-        return self.get_dict('files')
-    
-    @property
-    def logging_config(self) -> Dict:
-        """Get logging configuration.
-        
-        Returns:
-            Dict: Logging configuration section.
-        """
-        return self.get_dict('logging')
-    
-    @property
-    def openai_config(self) -> Dict:
-        """Get OpenAI configuration.
-        
-        Returns:
-            Dict: OpenAI configuration section.
-        """
-        return self.get_dict('openai')
-    
-    @property
-    def cache_config(self) -> Dict:
-        """Get cache configuration.
-        
-        Returns:
-            Dict: Cache configuration section.
-        """
-        return self.get_dict('cache')
-    
-    @property
-    def job_search_config(self) -> Dict:
-        """Get job search configuration.
-        
-        Returns:
-            Dict: Job search configuration section.
-        """
-        return self.get_dict('job_search')
-    
-    @property
-    def resume_processing_config(self) -> Dict:
-        """Get resume processing configuration.
-        
-        Returns:
-            Dict: Resume processing configuration section.
-        """
-        return self.get_dict('resume_processing')
-    
-    @property
-    def cleanup_config(self) -> Dict:
-        """Get cleanup configuration.
-        
-        Returns:
-            Dict: Cleanup configuration section.
-        """
-        return self.get_dict('cleanup')
-    
-    @property
-    def ui_config(self) -> Dict:
-        """Get UI configuration.
-        
-        Returns:
-            Dict: UI configuration section.
-        """
-        return self.get_dict('ui')
-    
-    @property
-    def development_config(self) -> Dict:
-        """Get development configuration.
-        
-        Returns:
-            Dict: Development configuration section.
-        """
-        return self.get_dict('development')
-    
-    @property
-    def security_config(self) -> Dict:
-        """Get security configuration.
-        
-        Returns:
-            Dict: Security configuration section.
-        """
-        return self.get_dict('security')
+        flat = self._flat
+        return [key for key in required_keys if flat.get(key) is None]
     
     # Specific getters with environment overrides for common values
     
@@ -431,7 +784,7 @@ class ConfigLoader:
         Returns:
             str: Upload folder path, defaults to 'uploads'.
         """
-        return self.get('files.upload_folder', 'uploads')
+        return self._upload_folder
     
     def get_max_file_size_bytes(self) -> int:
         """Get maximum file size in bytes.
@@ -439,17 +792,15 @@ class ConfigLoader:
         Returns:
             int: Maximum file size in bytes (converts from MB configuration).
         """
-        mb = self.get('files.max_file_size_mb', 16)
-        return mb * 1024 * 1024
+        return self._max_file_size_bytes
     
-    def get_allowed_extensions(self) -> set:
+    def get_allowed_extensions(self) -> frozenset:
         """Get allowed file extensions as a set.
         
         Returns:
-            set: Set of allowed file extensions.
+            frozenset: Shared, immutable set of allowed file extensions.
         """
-        extensions = self.get_list('files.allowed_extensions', ['txt', 'pdf', 'docx', 'doc'])
-        return set(extensions)
+        return self._allowed_extensions
     
     def get_cache_directory(self) -> str:
         """Get cache directory path.
@@ -457,7 +808,7 @@ class ConfigLoader:
         Returns:
             str: Cache directory path, defaults to '.cache'.
         """
-        return self.get('cache.directory', '.cache')
+        return self._cache_directory
     
     def get_cache_expiration_days(self) -> int:
         """Get cache expiration in days.
@@ -467,13 +818,22 @@ class ConfigLoader:
         """
         return self.get('cache.expiration_days', 7)
     
+    def get_cache_exclusive_dir(self) -> bool:
+        """Get whether the cache directory holds only cache files.
+        
+        Returns:
+            bool: True if clearing the cache may delete the whole directory,
+                defaults to False.
+        """
+        return self.get('cache.exclusive_dir', False)
+    
     def get_openai_model(self) -> str:
         """Get OpenAI model name.
         
         Returns:
             str: OpenAI model name, defaults to 'gpt-3.5-turbo'.
         """
-        return self.get('openai.model', 'gpt-3.5-turbo')
+        return self._openai_model
     
     def get_openai_temperature(self) -> float:
         """Get OpenAI temperature setting.
@@ -487,9 +847,10 @@ class ConfigLoader:
         """Get default job search sites.
         
         Returns:
-            List[str]: List of default job search sites.
+            List[str]: List of default job search sites (a new list per call,
+                since jobspy's ``site_name`` only accepts lists).
         """
-        return self.get_list('job_search.default_sites', ['indeed', 'linkedin'])
+        return list(self._job_search_sites)
     
     def get_default_job_results(self) -> int:
         """Get default number of job results.
@@ -507,14 +868,13 @@ class ConfigLoader:
         """
         return self.get('job_search.hours_old', 72)
     
-    def get_professional_domains(self) -> List[str]:
-        """Get list of professional domains to preserve in PII removal.
+    def get_professional_domains(self) -> frozenset:
+        """Get professional domains to preserve in PII removal.
         
         Returns:
-            List[str]: List of professional domains to preserve.
+            frozenset: Shared, immutable set of professional domains to preserve.
         """
-        return self.get_list('resume_processing.pii_removal.professional_domains', 
-                           ['github.com', 'linkedin.com', 'stackoverflow.com'])
+        return self._professional_domains
     
     def get_job_analysis_enabled(self) -> bool:
         """Get whether job analysis and ranking is enabled.
@@ -530,7 +890,7 @@ class ConfigLoader:
         Returns:
             Dict: Complete job analysis configuration section.
         """
-        return self.get_dict('job_analysis')
+        return self.job_analysis_config
     
     def get_max_jobs_to_analyze(self) -> int:
         """Get maximum number of jobs to analyze.
@@ -615,6 +975,8 @@ class ConfigLoader:
 
 # Global configuration instance
 _config_instance = None
+# Serializes first construction so concurrent callers don't each parse the YAML
+_config_instance_lock = threading.Lock()
 
 
 def get_config(config_file: str = None) -> ConfigLoader:
@@ -627,9 +989,13 @@ def get_config(config_file: str = None) -> ConfigLoader:
         ConfigLoader: The global ConfigLoader instance.
     """
     global _config_instance
-    if _config_instance is None:
-        _config_instance = ConfigLoader(config_file)
-    return _config_instance
+    instance = _config_instance
+    if instance is not None:
+        return instance
+    with _config_instance_lock:
+        if _config_instance is None:
+            _config_instance = ConfigLoader(config_file)
+        return _config_instance
 
 
 def reload_config() -> None:
@@ -637,9 +1003,9 @@ def reload_config() -> None:
     
     Forces the global configuration instance to reload from the configuration file.
     """
-    global _config_instance
-    if _config_instance:
-        _config_instance.reload()
+    instance = _config_instance
+    if instance is not None:
+        instance.reload()
 
 
 def config_get(key_path: str, default: Any = None, env_override: str = None) -> Any:
@@ -35,17 +35,19 @@ def test_redis_connection():
         test_key = "test_key_12345"
         test_value = "test_value_12345"
         
-        client.setex(test_key, 10, test_value)
+        # Set, get and clean up in one round trip
+        with client.pipeline(transaction=False) as pipe:
+            pipe.setex(test_key, 10, test_value)
+            pipe.get(test_key)
+            pipe.delete(test_key)
+            _, retrieved_value, _ = pipe.execute()
         logger.info("✓ Redis set successful")
         
-        retrieved_value = client.get(test_key)
         if retrieved_value == test_value:
             logger.info("✓ Redis get successful")
         else:
             logger.error(f"✗ Redis get failed. Expected: {test_value}, Got: {retrieved_value}")
         
-        # Clean up
-        client.delete(test_key)
         logger.info("✓ Redis delete successful")
         
         logger.info("🎉 All Redis operations successful!")
@@ -69,8 +71,10 @@ def test_environment():
         'OPENAI_API_KEY'
     ]
     
+    # Snapshot once and look each variable up locally
+    env = dict(os.environ)
     for var in env_vars:
-        value = os.getenv(var)
+        value = env.get(var)
         if value:
             # Don't log sensitive values in full
             if 'KEY' in var or 'SECRET' in var:
@@ -7,10 +7,13 @@ Command Line Interface for resume processing and job searching
 import csv
 import json
 import argparse
+import importlib.util
 import os
 import logging
+import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+import pandas as pd
 from dotenv import load_dotenv
 from jobspy import scrape_jobs
 from processors.resume_processor import ResumeProcessor
@@ -24,7 +27,49 @@ load_dotenv()
 config = get_config()
 logger = setup_logging()
 
-def test_resume_processing_pipeline(resume_file, target_location=None, desired_position=None, results_wanted=None):
+# Results CSVs are written through a 1 MB buffer, in blocks of this many rows
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+CSV_CHUNK_ROWS = 10_000
+
+# Supported results file formats, also used as the file extension; parquet
+# and arrow (Arrow IPC / Feather v2) need pyarrow
+OUTPUT_FORMATS = ('csv', 'parquet', 'arrow')
+
+@lru_cache(maxsize=1)
+def _get_processor():
+    """Return the ResumeProcessor shared by all commands in this process"""
+    return ResumeProcessor()
+
+@lru_cache(maxsize=1)
+def _get_job_results_dir():
+    """Return the job results directory, creating it on first use only"""
+    job_results_dir = Path(config.get('files.job_results_folder', 'job_results'))
+    job_results_dir.mkdir(parents=True, exist_ok=True)
+    return job_results_dir
+
+def _save_jobs(jobs, output_path, output_format='csv'):
+    """
+    Write the jobs DataFrame to output_path in the given format
+    
+    Args:
+        jobs (pd.DataFrame): Jobs to save
+        output_path (str): Destination file path
+        output_format (str, optional): One of OUTPUT_FORMATS. Defaults to 'csv'.
+    """
+    if output_format == 'parquet':
+        # Columnar and zstd-compressed; no per-cell stringification or quoting
+        jobs.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+    elif output_format == 'arrow':
+        jobs.to_feather(output_path, compression='zstd')
+    else:
+        # CSV through a large buffer, converting rows in blocks; only fields
+        # that need it (separators, quotes, newlines) are quoted
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            jobs.to_csv(f, quoting=csv.QUOTE_MINIMAL, escapechar="\\", index=False,
+                        chunksize=CSV_CHUNK_ROWS)
+
+def test_resume_processing_pipeline(resume_file, target_location=None, desired_position=None, results_wanted=None,
+                                    output_format='csv'):
     """
     Test the complete resume processing pipeline including job scraping
     
@@ -33,6 +78,7 @@ def test_resume_processing_pipeline(resume_file, target_location=None, desired_p
         target_location (str, optional): Target job location
         desired_position (str, optional): Desired job position
         results_wanted (int, optional): Number of job results to return
+        output_format (str, optional): Results file format, one of OUTPUT_FORMATS
     """
     logger.info(f"=== Starting Resume Processing Pipeline Test ===")
     logger.info(f"Resume file: {resume_file}")
@@ -42,7 +88,7 @@ def test_resume_processing_pipeline(resume_file, target_location=None, desired_p
     
     try:
         # Initialize processor
-        processor = ResumeProcessor()
+        processor = _get_processor()
         
         # Step 1: Process resume
         logger.info("Step 1: Processing resume...")
@@ -81,7 +127,8 @@ def test_resume_processing_pipeline(resume_file, target_location=None, desired_p
         logger.info(f"  - Location: '{location}'")
         logger.info(f"  - Results wanted: {results_wanted}")
         
-        # Perform job search using jobspy
+        # Perform job search using jobspy; it already scrapes the listed sites
+        # concurrently on its own thread pool and merges the results
         jobs = scrape_jobs(
             site_name=config.get_job_search_sites(),
             search_term=search_term,
@@ -110,12 +157,15 @@ def test_resume_processing_pipeline(resume_file, target_location=None, desired_p
                     max_jobs=config.get_max_jobs_to_analyze()
                 )
                 
-                # Convert back to DataFrame
-                import pandas as pd
-                jobs = pd.DataFrame(analyzed_jobs_list)
-                jobs_analyzed = True
+                # Convert back to DataFrame; the original frame is kept until here
+                # because the failure path below saves it unanalyzed
+                jobs = pd.DataFrame.from_records(analyzed_jobs_list)
                 
                 analyzed_count = sum(1 for job in analyzed_jobs_list if job.get('analyzed', False))
+                # Set only once the count exists, since the summary reads both
+                jobs_analyzed = True
+                # Release the per-row dicts before saving; only the DataFrame is needed now
+                del jobs_list, analyzed_jobs_list
                 logger.info(f"✓ Job analysis completed - {analyzed_count}/{len(jobs)} jobs analyzed")
                 
             except Exception as e:
@@ -128,17 +178,13 @@ def test_resume_processing_pipeline(resume_file, target_location=None, desired_p
         # Generate output filename
         resume_name = Path(resume_file).stem
         position_suffix = f"_{desired_position.replace(' ', '_').lower()}" if desired_position else ""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"jobs_{resume_name}{position_suffix}_{timestamp}.csv"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        output_filename = f"jobs_{resume_name}{position_suffix}_{timestamp}.{output_format}"
         
-        # Ensure job results directory exists
-        job_results_folder = config.get('files.job_results_folder', 'job_results')
-        os.makedirs(job_results_folder, exist_ok=True)
+        # Job results directory is resolved and created once per process
+        output_path = str(_get_job_results_dir() / output_filename)
         
-        output_path = os.path.join(job_results_folder, output_filename)
-        
-        # Save results to CSV
-        jobs.to_csv(output_path, quoting=csv.QUOTE_NONNUMERIC, escapechar="\\", index=False)
+        _save_jobs(jobs, output_path, output_format)
         
         logger.info(f"✓ Results saved to: {output_path}")
         
@@ -146,7 +192,7 @@ def test_resume_processing_pipeline(resume_file, target_location=None, desired_p
         logger.info(f"=== Pipeline Test Complete ===")
         logger.info(f"Total jobs found: {len(jobs)}")
         if jobs_analyzed:
-            analyzed_count = sum(1 for _, job in jobs.iterrows() if job.get('analyzed', False))
+            # Counted from analyzed_jobs_list in step 3; no need to walk the DataFrame rows
             logger.info(f"Jobs analyzed: {analyzed_count}")
         logger.info(f"Results file: {output_filename}")
         
@@ -180,7 +226,7 @@ def simple_resume_test(resume_file, target_location=None, desired_position=None)
     
     try:
         # Initialize processor
-        processor = ResumeProcessor()
+        processor = _get_processor()
         
         # Process resume
         logger.info("Processing resume...")
@@ -228,7 +274,7 @@ def show_cache_info():
     logger.info("Displaying cache information")
     
     try:
-        processor = ResumeProcessor()
+        processor = _get_processor()
         cache_info = processor.get_cache_info()
         
         print("\n=== CACHE INFORMATION ===")
@@ -253,7 +299,7 @@ def clear_cache():
     logger.info("Clearing application cache")
     
     try:
-        processor = ResumeProcessor()
+        processor = _get_processor()
         processor.clear_cache()
         logger.info("✓ Cache cleared successfully")
         print("Cache cleared successfully!")
@@ -270,6 +316,7 @@ def main():
         epilog="""
 Examples:
   python main.py test resume.pdf --position "Software Engineer" --location "San Francisco, CA" --results 50
+  python main.py test resume.pdf --format parquet
   python main.py simple resume.pdf --position "Data Scientist"
   python main.py cache-info
   python main.py clear-cache
@@ -284,6 +331,8 @@ Examples:
     test_parser.add_argument('--position', help='Desired job position')
     test_parser.add_argument('--location', help='Target job location')
     test_parser.add_argument('--results', type=int, help='Number of job results to fetch')
+    test_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv',
+                             help='Results file format (parquet and arrow require pyarrow)')
     
     # Simple command (resume processing only)
     simple_parser = subparsers.add_parser('simple', help='Simple resume processing without job search')
@@ -302,11 +351,17 @@ Examples:
             print(f"Error: Resume file '{args.resume_file}' not found")
             return 1
         
+        # Fail before scraping and analysis rather than when saving the results
+        if args.format != 'csv' and importlib.util.find_spec('pyarrow') is None:
+            print(f"Error: --format {args.format} requires pyarrow to be installed")
+            return 1
+        
         result = test_resume_processing_pipeline(
             args.resume_file,
             target_location=args.location,
             desired_position=args.position,
-            results_wanted=args.results
+            results_wanted=args.results,
+            output_format=args.format
         )
         
         if result['success']:
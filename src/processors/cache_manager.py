@@ -1,12 +1,82 @@
 import os
 import json
+import shutil
 import hashlib
 import logging
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Tuple
 from config_loader import get_config
 
+# Used to turn epoch-second differences into cache ages in days
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# Serialized entries at least this large are zstd-compressed (when available)
+COMPRESS_MIN_BYTES = 16 * 1024
+ZSTD_LEVEL = 1
+
+# Cache entries are stored as <key><suffix>; compressed entries get their own
+# suffix so readers that parse *.json as text never see zstd data
+CACHE_FILE_SUFFIX = '.json'
+COMPRESSED_CACHE_FILE_SUFFIX = '.json.zst'
+CACHE_FILE_SUFFIXES = (CACHE_FILE_SUFFIX, COMPRESSED_CACHE_FILE_SUFFIX)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _dumps_cache_entry(data: Dict) -> Tuple[bytes, bool]:
+    """Serialize a cache entry to compact JSON bytes, using orjson when installed.
+    
+    Large payloads are compressed with zstd when zstandard is installed.
+    
+    Returns:
+        Tuple[bytes, bool]: The serialized entry, and whether it is compressed.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    if zstandard is not None and len(payload) >= COMPRESS_MIN_BYTES:
+        return zstandard.compress(payload, ZSTD_LEVEL), True
+    return payload, False
+
+
+def read_cache_file(cache_file: Path) -> Dict:
+    """Read and parse a cache entry file, decompressing ``.json.zst`` entries.
+    
+    Args:
+        cache_file (Path): Path to a file named with one of ``CACHE_FILE_SUFFIXES``.
+    
+    Returns:
+        Dict: The parsed cache entry.
+    
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the entry is invalid JSON, or is compressed and
+            zstandard is not installed.
+    """
+    raw = cache_file.read_bytes()
+    if cache_file.name.endswith(COMPRESSED_CACHE_FILE_SUFFIX):
+        if zstandard is None:
+            raise ValueError("Compressed cache entry but zstandard is not installed")
+        try:
+            raw = zstandard.decompress(raw)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid compressed cache entry: {e}") from e
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class CacheManager:
     """
@@ -71,9 +141,11 @@ class CacheManager:
         """
         Generate a unique cache key based on content, operation, and additional parameters.
         
-        Creates a deterministic cache key by combining the operation type, content,
-        and any additional parameters into a SHA-256 hash. This ensures that
-        identical inputs always produce the same cache key.
+        Creates a deterministic cache key by hashing the operation type, content,
+        and any additional parameters with BLAKE2b (8-byte digest). This ensures
+        that identical inputs always produce the same cache key. The parts are
+        fed to the hash one at a time, so the content is never copied into a
+        combined input string.
         
         Args:
             content (str): The main content to be cached (e.g., resume text)
@@ -88,14 +160,18 @@ class CacheManager:
             >>> key = manager.generate_cache_key("resume text", "gpt_analysis", model="gpt-4")
             >>> print(key)  # e.g., "a1b2c3d4e5f67890"
         """
-        # Create a string that includes content + operation + any additional parameters
-        cache_input = f"{operation}:{content}"
+        # Hash operation + content + any additional parameters; a cache key only
+        # needs to be well distributed, not cryptographically strong
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(operation.encode())
+        hasher.update(b':')
+        hasher.update(content.encode())
         for key, value in sorted(kwargs.items()):
-            cache_input += f":{key}={value}"
+            hasher.update(f":{key}={value}".encode())
         
-        # Create SHA-256 hash of the input
-        cache_key = hashlib.sha256(cache_input.encode()).hexdigest()[:16]
-        self.logger.debug(f"Generated cache key {cache_key} for operation: {operation}")
+        # 8-byte digest is exactly 16 hex characters
+        cache_key = hasher.hexdigest()
+        self.logger.debug("Generated cache key %s for operation: %s", cache_key, operation)
         return cache_key
     
     def get_cached_response(self, cache_key: str) -> Dict:
@@ -126,44 +202,70 @@ class CacheManager:
             ... else:
             ...     print("Cache miss or expired")
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        
-        if not cache_file.exists():
-            self.logger.debug(f"No cache file found for key: {cache_key}")
+        for suffix in CACHE_FILE_SUFFIXES:
+            cache_file = self.cache_dir / f"{cache_key}{suffix}"
+            try:
+                # Read directly rather than checking exists() first: a miss costs
+                # a failed open instead of a stat plus an open
+                cached_data = read_cache_file(cache_file)
+                break
+            except FileNotFoundError:
+                continue
+            except (ValueError, OSError) as e:
+                # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
+                self._remove_corrupted(cache_file, cache_key, e)
+                return {}
+        else:
+            self.logger.debug("No cache file found for key: %s", cache_key)
             return {}
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cached_data = json.load(f)
-            
-            # Check if cache is expired
-            cache_time = datetime.fromisoformat(cached_data.get('timestamp', ''))
+            # Check if cache is expired; the epoch 'created_at' avoids parsing
+            # the ISO timestamp, which only entries written before it exist need
+            created_at = cached_data.get('created_at')
+            if created_at is None:
+                created_at = datetime.fromisoformat(cached_data.get('timestamp', '')).timestamp()
             expiration_days = self.config.get_cache_expiration_days()
-            if (datetime.now() - cache_time).days < expiration_days:
+            # Age computed once and reused by the check and the log lines
+            age_days = int((time.time() - created_at) // SECONDS_PER_DAY)
+            if age_days < expiration_days:
                 self.logger.info(f"Using cached response for {cache_key[:8]}...")
-                self.logger.debug(f"Cache hit - file: {cache_file}, age: {(datetime.now() - cache_time).days} days")
+                self.logger.debug("Cache hit - file: %s, age: %d days", cache_file, age_days)
                 return cached_data.get('response', {})
             else:
                 # Cache expired, remove it
                 cache_file.unlink()
-                self.logger.info(f"Expired cache removed for {cache_key[:8]} (age: {(datetime.now() - cache_time).days} days)")
-        except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
-            # Invalid or corrupted cache file, remove it
-            try:
-                cache_file.unlink()
-                self.logger.warning(f"Corrupted cache removed for {cache_key[:8]}: {e}")
-            except OSError:
-                self.logger.error(f"Failed to remove corrupted cache file: {cache_file}")
+                self.logger.info(f"Expired cache removed for {cache_key[:8]} (age: {age_days} days)")
+        except (KeyError, ValueError, TypeError, OSError) as e:
+            self._remove_corrupted(cache_file, cache_key, e)
         
         return {}
     
+    def _remove_corrupted(self, cache_file: Path, cache_key: str, error: Exception) -> None:
+        """
+        Remove an invalid or corrupted cache file, logging the outcome.
+        
+        Args:
+            cache_file (Path): The cache file to remove
+            cache_key (str): The cache key the file belongs to
+            error (Exception): The error raised while reading or validating it
+        """
+        try:
+            cache_file.unlink()
+            self.logger.warning(f"Corrupted cache removed for {cache_key[:8]}: {error}")
+        except OSError:
+            self.logger.error(f"Failed to remove corrupted cache file: {cache_file}")
+    
     def save_cached_response(self, cache_key: str, response: Dict) -> None:
         """
         Save a response to the cache with the current timestamp.
         
-        Stores the response data along with a timestamp in a JSON file
-        named after the cache key. The timestamp is used for expiration
-        checking when retrieving cached responses.
+        Stores the response data along with its creation time in a JSON file
+        named after the cache key (``<key>.json``, or ``<key>.json.zst`` when
+        compressed), both as an ISO ``timestamp`` and as epoch seconds
+        (``created_at``). The epoch value is used for expiration checking when
+        retrieving cached responses. An older entry for the same key under the
+        other file name is removed after the write.
         
         Args:
             cache_key (str): The cache key to store the response under
@@ -182,28 +284,47 @@ class CacheManager:
             >>> manager.save_cached_response("a1b2c3d4e5f67890", response)
         """
         try:
-            cache_file = self.cache_dir / f"{cache_key}.json"
+            now = time.time()
             cache_data = {
-                'timestamp': datetime.now().isoformat(),
+                # ISO string kept for the legacy resume_processor module's readers
+                'timestamp': datetime.fromtimestamp(now).isoformat(),
+                'created_at': now,
                 'response': response
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            # Compact (and, if large, compressed) JSON written in one call
+            payload, compressed = _dumps_cache_entry(cache_data)
+            if compressed:
+                suffix, stale_suffix = COMPRESSED_CACHE_FILE_SUFFIX, CACHE_FILE_SUFFIX
+            else:
+                suffix, stale_suffix = CACHE_FILE_SUFFIX, COMPRESSED_CACHE_FILE_SUFFIX
+            cache_file = self.cache_dir / f"{cache_key}{suffix}"
+            cache_file.write_bytes(payload)
+            
+            # An older entry under the other suffix would shadow (or be shadowed
+            # by) this one on lookup, so drop it once the new entry is written
+            try:
+                (self.cache_dir / f"{cache_key}{stale_suffix}").unlink()
+            except FileNotFoundError:
+                pass
             
             self.logger.info(f"Cached response for {cache_key[:8]}...")
-            self.logger.debug(f"Cache saved to: {cache_file}")
+            self.logger.debug("Cache saved to: %s", cache_file)
         except Exception as e:
             self.logger.error(f"Could not save cache for {cache_key[:8]}: {e}")
     
     def clear_cache(self) -> Dict:
         """
-        Remove all JSON cache files in the cache directory and return statistics.
+        Remove all cache files in the cache directory and return statistics.
 
-        Iterates through the cache directory and deletes each `.json` file. Logs and ignores
+        Iterates through the cache directory and deletes each `.json` and `.json.zst` file. Logs and ignores
         any errors encountered while removing individual files. If scanning the directory
         fails, the exception is logged and re-raised.
 
+        When ``cache.exclusive_dir`` is enabled, the directory is known to hold only cache
+        files, so it is removed as a whole and recreated instead of unlinking file by file.
+        This never applies when the manager has fallen back to the current directory.
+
         Returns:
             Dict[str, Any]: Statistics of the clearing operation:
                 - files_removed (int): number of files successfully removed
@@ -218,19 +339,26 @@ class CacheManager:
             self.logger.info("Cache directory doesn't exist - nothing to clear")
             return {'files_removed': 0, 'space_freed_mb': 0}
         
+        if self.config.get_cache_exclusive_dir() and self.cache_dir != Path("."):
+            return self._clear_cache_directory()
+        
         files_removed = 0
         total_size_freed = 0
         
         try:
-            for cache_file in self.cache_dir.glob('*.json'):
-                try:
-                    file_size = cache_file.stat().st_size
-                    cache_file.unlink()
-                    files_removed += 1
-                    total_size_freed += file_size
-                    self.logger.debug(f"Removed cache file: {cache_file.name}")
-                except Exception as e:
-                    self.logger.error(f"Could not remove cache file {cache_file}: {e}")
+            # scandir + os.unlink on the entry path: no glob, no Path per file
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(CACHE_FILE_SUFFIXES):
+                        continue
+                    try:
+                        file_size = entry.stat().st_size
+                        os.unlink(entry.path)
+                        files_removed += 1
+                        total_size_freed += file_size
+                        self.logger.debug("Removed cache file: %s", entry.name)
+                    except Exception as e:
+                        self.logger.error(f"Could not remove cache file {entry.path}: {e}")
                     
         except Exception as e:
             self.logger.error(f"Error clearing cache: {e}")
@@ -244,6 +372,44 @@ class CacheManager:
             'space_freed_mb': space_freed_mb
         }
     
+    def _clear_cache_directory(self) -> Dict:
+        """
+        Clear an exclusive cache directory by removing and recreating it.
+
+        Sizes of the `.json` and `.json.zst` cache files are totalled from a single scan before the
+        directory tree is removed in one call.
+
+        Returns:
+            Dict[str, Any]: Statistics in the same form as ``clear_cache``.
+
+        Raises:
+            OSError: If the directory cannot be scanned or removed.
+        """
+        files_removed = 0
+        total_size_freed = 0
+        
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(CACHE_FILE_SUFFIXES) and entry.is_file():
+                        files_removed += 1
+                        total_size_freed += entry.stat().st_size
+            shutil.rmtree(self.cache_dir)
+        except OSError as e:
+            self.logger.error(f"Error clearing cache directory {self.cache_dir}: {e}")
+            raise
+        finally:
+            # Recreate even after a partial removal so later saves still work
+            self._ensure_cache_directory()
+        
+        space_freed_mb = round(total_size_freed / (1024 * 1024), 2)
+        self.logger.info(f"Cache directory cleared: {files_removed} files removed, {space_freed_mb} MB freed")
+        
+        return {
+            'files_removed': files_removed,
+            'space_freed_mb': space_freed_mb
+        }
+    
     def get_cache_info(self) -> Dict:
         """
         Get comprehensive information about cached files and cache directory status.
@@ -289,20 +455,27 @@ class CacheManager:
         cache_files = []
         total_size = 0
         
+        # One clock read for the whole scan instead of one per file
+        now_ts = time.time()
+        
         try:
-            for cache_file in self.cache_dir.glob('*.json'):
-                try:
-                    stat = cache_file.stat()
-                    file_info = {
-                        'name': cache_file.name,
-                        'size_bytes': stat.st_size,
-                        'modified': stat.st_mtime,
-                        'age_days': (datetime.now().timestamp() - stat.st_mtime) / (24 * 60 * 60)
-                    }
-                    cache_files.append(file_info)
-                    total_size += stat.st_size
-                except Exception as e:
-                    self.logger.warning(f"Could not get info for cache file {cache_file}: {e}")
+            # scandir yields names without building a Path per file or matching a glob
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(CACHE_FILE_SUFFIXES):
+                        continue
+                    try:
+                        stat = entry.stat()
+                        file_info = {
+                            'name': entry.name,
+                            'size_bytes': stat.st_size,
+                            'modified': stat.st_mtime,
+                            'age_days': (now_ts - stat.st_mtime) / SECONDS_PER_DAY
+                        }
+                        cache_files.append(file_info)
+                        total_size += stat.st_size
+                    except Exception as e:
+                        self.logger.warning(f"Could not get info for cache file {entry.path}: {e}")
                     
         except Exception as e:
             self.logger.error(f"Error getting cache info: {e}")
@@ -318,4 +491,28 @@ class CacheManager:
         }
         
         self.logger.debug(f"Cache info: {len(cache_files)} files, {cache_info['total_size_mb']} MB")
-        return cache_info 
\ No newline at end of file
+        return cache_info
+
+
+@lru_cache(maxsize=4)
+def _cache_manager_for(cache_dir: str) -> CacheManager:
+    """Return the shared CacheManager for a resolved cache directory."""
+    return CacheManager(cache_dir)
+
+
+def get_cache_manager(cache_dir: str = None) -> CacheManager:
+    """Get the shared CacheManager for a cache directory.
+    
+    Instances are reused per directory, so repeated callers skip the config
+    lookup and directory creation. Without ``cache_dir`` the directory is
+    resolved from the current configuration on every call, so a changed
+    ``cache.directory`` setting still takes effect.
+    
+    Args:
+        cache_dir (str, optional): Cache directory path. Defaults to the
+            configured cache directory.
+        
+    Returns:
+        CacheManager: The shared instance for that directory.
+    """
+    return _cache_manager_for(str(cache_dir or get_config().get_cache_directory()))
@@ -3,6 +3,20 @@ import logging
 from config_loader import get_config
 
 
+# Compiled PII patterns shared by all PIIAnonymizer instances
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = [
+    re.compile(r'\b\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b'),  # (555) 123-4567, 555-123-4567, 555.123.4567
+    re.compile(r'\b(\d{3})[-.\s](\d{3})[-.\s](\d{4})\b'),          # 555 123 4567
+    re.compile(r'\+1[-.\s]?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b')  # +1 (555) 123-4567
+]
+_ADDRESS_RES = [
+    re.compile(r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)\b.*'),
+    re.compile(r'\b[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?\b')  # City, ST 12345 or City, ST 12345-6789
+]
+_URL_RE = re.compile(r'https?://(?:www\.)?[A-Za-z0-9.-]+\.[A-Za-z]{2,}(?:/[^\s]*)?')
+
+
 class PIIAnonymizer:
     """Handles PII (Personally Identifiable Information) removal and anonymization from resume content.
     
@@ -162,12 +176,10 @@ class PIIAnonymizer:
             - The pattern requires a valid TLD of at least 2 characters
             - Email addresses within larger URLs or complex formatting may not be detected
         """
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails_found = re.findall(email_pattern, content)
-        if emails_found:
-            content = re.sub(email_pattern, '[EMAIL_REDACTED]', content)
-            self.logger.debug(f"Found and redacted {len(emails_found)} email addresses")
-        return content, len(emails_found)
+        content, emails_count = _EMAIL_RE.subn('[EMAIL_REDACTED]', content)
+        if emails_count:
+            self.logger.debug(f"Found and redacted {emails_count} email addresses")
+        return content, emails_count
     
     def _remove_phone_numbers(self, content: str) -> tuple[str, int]:
         """Remove phone numbers from content using multiple regex patterns.
@@ -212,19 +224,12 @@ class PIIAnonymizer:
             - The patterns are applied sequentially, so a phone number should only be matched once
             - Very non-standard formats may not be detected and would require pattern updates
         """
-        phone_patterns = [
-            r'\b\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b',  # (555) 123-4567, 555-123-4567, 555.123.4567
-            r'\b(\d{3})[-.\s](\d{3})[-.\s](\d{4})\b',          # 555 123 4567
-            r'\+1[-.\s]?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b'  # +1 (555) 123-4567
-        ]
-        
         total_phones_found = 0
-        for i, pattern in enumerate(phone_patterns):
-            phones_found = re.findall(pattern, content)
-            if phones_found:
-                content = re.sub(pattern, '[PHONE_REDACTED]', content)
-                total_phones_found += len(phones_found)
-                self.logger.debug(f"Found and redacted {len(phones_found)} phone numbers with pattern {i+1}")
+        for i, pattern in enumerate(_PHONE_RES):
+            content, phones_count = pattern.subn('[PHONE_REDACTED]', content)
+            if phones_count:
+                total_phones_found += phones_count
+                self.logger.debug(f"Found and redacted {phones_count} phone numbers with pattern {i+1}")
         
         return content, total_phones_found
     
@@ -267,18 +272,12 @@ class PIIAnonymizer:
             - International address formats are not currently supported
             - Partial matches (like standalone ZIP codes) may not be detected
         """
-        address_patterns = [
-            r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)\b.*',
-            r'\b[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?\b'  # City, ST 12345 or City, ST 12345-6789
-        ]
-        
         total_addresses_found = 0
-        for i, pattern in enumerate(address_patterns):
-            addresses_found = re.findall(pattern, content)
-            if addresses_found:
-                content = re.sub(pattern, '[ADDRESS_REDACTED]', content)
-                total_addresses_found += len(addresses_found)
-                self.logger.debug(f"Found and redacted {len(addresses_found)} addresses with pattern {i+1}")
+        for i, pattern in enumerate(_ADDRESS_RES):
+            content, addresses_count = pattern.subn('[ADDRESS_REDACTED]', content)
+            if addresses_count:
+                total_addresses_found += addresses_count
+                self.logger.debug(f"Found and redacted {addresses_count} addresses with pattern {i+1}")
         
         return content, total_addresses_found
     
@@ -328,31 +327,26 @@ class PIIAnonymizer:
             - Common professional domains typically include: linkedin.com, github.com, etc.
             - The domain matching is case-insensitive for better reliability
         """
-        url_pattern = r'https?://(?:www\.)?[A-Za-z0-9.-]+\.[A-Za-z]{2,}(?:/[^\s]*)?'
-        urls_found = re.findall(url_pattern, content)
-        
-        if not urls_found:
-            return content, 0
-        
+        # Only redact personal domains if preserve_professional_urls is enabled
+        preserve_professional = self.config.get('resume_processing.pii_removal.preserve_professional_urls', True)
+        professional_domains = self.config.get_professional_domains() if preserve_professional else []
         personal_urls_count = 0
         
-        # Only redact personal domains if preserve_professional_urls is enabled
-        if self.config.get('resume_processing.pii_removal.preserve_professional_urls', True):
-            professional_domains = self.config.get_professional_domains()
-            for url in urls_found:
-                is_professional = any(domain in url.lower() for domain in professional_domains)
-                if not is_professional:
-                    content = content.replace(url, '[WEBSITE_REDACTED]')
-                    personal_urls_count += 1
-            
-            if personal_urls_count > 0:
-                self.logger.debug(f"Redacted {personal_urls_count} personal URLs, preserved {len(urls_found) - personal_urls_count} professional URLs")
-        else:
-            # Redact all URLs
-            for url in urls_found:
-                content = content.replace(url, '[WEBSITE_REDACTED]')
-            personal_urls_count = len(urls_found)
-            self.logger.debug(f"Redacted all {len(urls_found)} URLs")
+        def redact_url(match):
+            nonlocal personal_urls_count
+            url = match.group(0)
+            lowered = url.lower()
+            if any(domain in lowered for domain in professional_domains):
+                return url
+            personal_urls_count += 1
+            return '[WEBSITE_REDACTED]'
+        
+        content, urls_count = _URL_RE.subn(redact_url, content)
+        
+        if not preserve_professional and urls_count:
+            self.logger.debug(f"Redacted all {urls_count} URLs")
+        elif personal_urls_count > 0:
+            self.logger.debug(f"Redacted {personal_urls_count} personal URLs, preserved {urls_count - personal_urls_count} professional URLs")
         
         return content, personal_urls_count
     
@@ -3,11 +3,11 @@ import json
 import logging
 from datetime import datetime
 from typing import List, Dict
-from openai import OpenAI
 from config_loader import get_config
+from utils.openai_client import get_openai_client
 from .file_reader import FileReader
 from .pii_anonymizer import PIIAnonymizer
-from .cache_manager import CacheManager
+from .cache_manager import get_cache_manager
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
@@ -32,13 +32,13 @@ class ResumeProcessor:
             OSError: If the cache directory can’t be created or accessed.
         """
         self.config = get_config()
-        self.client = OpenAI(api_key=self.config.get_openai_api_key())
+        self.client = get_openai_client(self.config)
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
         # Initialize component processors
         self.file_reader = FileReader()
         self.pii_anonymizer = PIIAnonymizer()
-        self.cache_manager = CacheManager(cache_dir)
+        self.cache_manager = get_cache_manager(cache_dir)
     
     def process_resume(self, resume_file_path: str, target_location: str = None, desired_position: str = None) -> Dict:
         """Run a resume through the full pipeline: read → anonymize → extract keywords → generate search terms.
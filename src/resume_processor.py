@@ -10,21 +10,44 @@ import re
 import json
 import hashlib
 import logging
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
-from openai import OpenAI
 from typing import List, Dict, Optional, Any
-import PyPDF2
+import pypdf
 from docx import Document
 from config_loader import get_config
+from utils.openai_client import get_openai_client
+from processors.cache_manager import CACHE_FILE_SUFFIXES, read_cache_file
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+# Matches a ```json fenced block in model responses
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+# PII patterns used by anonymize_resume
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = [
+    re.compile(r'\b\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b'),  # (555) 123-4567, 555-123-4567, 555.123.4567
+    re.compile(r'\b(\d{3})[-.\s](\d{3})[-.\s](\d{4})\b'),          # 555 123 4567
+    re.compile(r'\+1[-.\s]?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b')  # +1 (555) 123-4567
+]
+_ADDRESS_RES = [
+    re.compile(r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)\b.*'),
+    re.compile(r'\b[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?\b')  # City, ST 12345 or City, ST 12345-6789
+]
+_URL_RE = re.compile(r'https?://(?:www\.)?[A-Za-z0-9.-]+\.[A-Za-z]{2,}(?:/[^\s]*)?')
+
 class ResumeProcessor:
+    # Raw-resume fingerprint -> extract_keywords cache key, shared across instances
+    _raw_to_cache_key: Dict[str, str] = {}
+    _RAW_KEY_MAP_MAX = 1024
+
     def __init__(self, cache_dir: str = None):
         self.config = get_config()
-        self.client = OpenAI(api_key=self.config.get_openai_api_key())
+        self.client = get_openai_client(self.config)
         self.cache_dir = Path(cache_dir or self.config.get_cache_directory())
         
         # Set up logging for this class
@@ -45,15 +68,21 @@ class ResumeProcessor:
 
     def _generate_cache_key(self, content: str, operation: str, **kwargs) -> str:
         """Generate a unique cache key based on content and parameters"""
+        cache_key = self._hash_cache_input(content, operation, tuple(sorted(kwargs.items())))
+        self.logger.debug(f"Generated cache key {cache_key} for operation: {operation}")
+        return cache_key
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _hash_cache_input(content: str, operation: str, extras: tuple) -> str:
+        """Hash content + operation + parameters (memoized to skip re-hashing repeated content)"""
         # Create a string that includes content + operation + any additional parameters
         cache_input = f"{operation}:{content}"
-        for key, value in sorted(kwargs.items()):
+        for key, value in extras:
             cache_input += f":{key}={value}"
         
         # Create SHA-256 hash of the input
-        cache_key = hashlib.sha256(cache_input.encode()).hexdigest()[:16]
-        self.logger.debug(f"Generated cache key {cache_key} for operation: {operation}")
-        return cache_key
+        return hashlib.sha256(cache_input.encode()).hexdigest()[:16]
     
     def _get_cached_response(self, cache_key: str) -> Dict:
         """Retrieve cached response if it exists and is valid"""
@@ -119,63 +148,49 @@ class ResumeProcessor:
         pii_removed = []
         
         # 1. Email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails_found = re.findall(email_pattern, content)
-        if emails_found:
-            content = re.sub(email_pattern, '[EMAIL_REDACTED]', content)
-            pii_removed.append(f"{len(emails_found)} email(s)")
-            self.logger.debug(f"Found and redacted {len(emails_found)} email addresses")
+        content, emails_count = _EMAIL_RE.subn('[EMAIL_REDACTED]', content)
+        if emails_count:
+            pii_removed.append(f"{emails_count} email(s)")
+            self.logger.debug(f"Found and redacted {emails_count} email addresses")
         
         # 2. Phone numbers (various formats)
-        phone_patterns = [
-            r'\b\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b',  # (555) 123-4567, 555-123-4567, 555.123.4567
-            r'\b(\d{3})[-.\s](\d{3})[-.\s](\d{4})\b',          # 555 123 4567
-            r'\+1[-.\s]?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\b'  # +1 (555) 123-4567
-        ]
-        
-        for i, pattern in enumerate(phone_patterns):
-            phones_found = re.findall(pattern, content)
-            if phones_found:
-                content = re.sub(pattern, '[PHONE_REDACTED]', content)
-                pii_removed.append(f"{len(phones_found)} phone number(s)")
-                self.logger.debug(f"Found and redacted {len(phones_found)} phone numbers with pattern {i+1}")
+        for i, pattern in enumerate(_PHONE_RES):
+            content, phones_count = pattern.subn('[PHONE_REDACTED]', content)
+            if phones_count:
+                pii_removed.append(f"{phones_count} phone number(s)")
+                self.logger.debug(f"Found and redacted {phones_count} phone numbers with pattern {i+1}")
         
         # 3. Physical addresses (basic patterns)
         # Remove lines that look like addresses (number + street + city/state/zip patterns)
-        address_patterns = [
-            r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)\b.*',
-            r'\b[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?\b'  # City, ST 12345 or City, ST 12345-6789
-        ]
-        
-        for i, pattern in enumerate(address_patterns):
-            addresses_found = re.findall(pattern, content)
-            if addresses_found:
-                content = re.sub(pattern, '[ADDRESS_REDACTED]', content)
-                pii_removed.append(f"{len(addresses_found)} address(es)")
-                self.logger.debug(f"Found and redacted {len(addresses_found)} addresses with pattern {i+1}")
+        for i, pattern in enumerate(_ADDRESS_RES):
+            content, addresses_count = pattern.subn('[ADDRESS_REDACTED]', content)
+            if addresses_count:
+                pii_removed.append(f"{addresses_count} address(es)")
+                self.logger.debug(f"Found and redacted {addresses_count} addresses with pattern {i+1}")
         
         # 4. Personal websites/portfolios
-        url_pattern = r'https?://(?:www\.)?[A-Za-z0-9.-]+\.[A-Za-z]{2,}(?:/[^\s]*)?'
-        urls_found = re.findall(url_pattern, content)
-        if urls_found:
-            # Only redact personal domains if preserve_professional_urls is enabled
-            if self.config.get('resume_processing.pii_removal.preserve_professional_urls', True):
-                professional_domains = self.config.get_professional_domains()
-                personal_urls = []
-                for url in urls_found:
-                    is_professional = any(domain in url.lower() for domain in professional_domains)
-                    if not is_professional:
-                        content = content.replace(url, '[WEBSITE_REDACTED]')
-                        personal_urls.append(url)
-                if personal_urls:
-                    pii_removed.append(f"{len(personal_urls)} personal website(s)")
-                    self.logger.debug(f"Redacted {len(personal_urls)} personal URLs, preserved {len(urls_found) - len(personal_urls)} professional URLs")
+        # Only redact personal domains if preserve_professional_urls is enabled
+        preserve_professional = self.config.get('resume_processing.pii_removal.preserve_professional_urls', True)
+        professional_domains = self.config.get_professional_domains() if preserve_professional else []
+        personal_urls_count = 0
+        
+        def redact_url(match):
+            nonlocal personal_urls_count
+            url = match.group(0)
+            lowered = url.lower()
+            if any(domain in lowered for domain in professional_domains):
+                return url
+            personal_urls_count += 1
+            return '[WEBSITE_REDACTED]'
+        
+        content, urls_count = _URL_RE.subn(redact_url, content)
+        if personal_urls_count:
+            if preserve_professional:
+                pii_removed.append(f"{personal_urls_count} personal website(s)")
+                self.logger.debug(f"Redacted {personal_urls_count} personal URLs, preserved {urls_count - personal_urls_count} professional URLs")
             else:
-                # Redact all URLs
-                for url in urls_found:
-                    content = content.replace(url, '[WEBSITE_REDACTED]')
-                pii_removed.append(f"{len(urls_found)} website(s)")
-                self.logger.debug(f"Redacted all {len(urls_found)} URLs")
+                pii_removed.append(f"{personal_urls_count} website(s)")
+                self.logger.debug(f"Redacted all {personal_urls_count} URLs")
         
         # 5. Names (more complex - try to identify the name at the top of resume)
         lines = content.split('\n')
@@ -216,7 +231,7 @@ class ResumeProcessor:
                 self.logger.debug("Processing PDF file")
                 text = ""
                 with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
+                    pdf_reader = pypdf.PdfReader(file)
                     page_count = len(pdf_reader.pages)
                     self.logger.debug(f"PDF has {page_count} pages")
                     for i, page in enumerate(pdf_reader.pages):
@@ -251,12 +266,24 @@ class ResumeProcessor:
         """Extract relevant keywords and information from resume using OpenAI"""
         self.logger.info("Starting keyword extraction from resume")
         
+        # Cheap fingerprint of the raw resume lets repeat uploads skip anonymization
+        raw_key = hashlib.blake2b(resume_content.encode(), digest_size=8).hexdigest()
+        known_cache_key = self._raw_to_cache_key.get(raw_key)
+        if known_cache_key:
+            cached_response = self._get_cached_response(known_cache_key)
+            if cached_response:
+                self.logger.info("Using cached keyword extraction results (raw resume match)")
+                return cached_response
+        
         # Anonymize the resume content before sending to API
         anonymized_content = self.anonymize_resume(resume_content)
         self.logger.debug(f"Resume anonymized - content length: {len(anonymized_content)} characters")
         
         # Check cache first
         cache_key = self._generate_cache_key(anonymized_content, "extract_keywords")
+        if len(self._raw_to_cache_key) >= self._RAW_KEY_MAP_MAX:
+            self._raw_to_cache_key.clear()
+        self._raw_to_cache_key[raw_key] = cache_key
         cached_response = self._get_cached_response(cache_key)
         if cached_response:
             self.logger.info("Using cached keyword extraction results")
@@ -309,8 +336,7 @@ class ResumeProcessor:
             except json.JSONDecodeError:
                 self.logger.warning("Initial JSON parsing failed, trying to extract from markdown code blocks")
                 # If JSON parsing fails, try to extract JSON from markdown code blocks
-                import re
-                json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     result = json.loads(json_match.group(1))
                     self.logger.info("Successfully extracted JSON from markdown code blocks")
@@ -394,8 +420,7 @@ class ResumeProcessor:
                 self.logger.info("Successfully parsed search terms generation JSON response")
             except json.JSONDecodeError:
                 self.logger.warning("Initial JSON parsing failed, trying to extract from markdown code blocks")
-                import re
-                json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     result = json.loads(json_match.group(1))
                     self.logger.info("Successfully extracted JSON from markdown code blocks")
@@ -416,10 +441,10 @@ class ResumeProcessor:
         """Clear all cached responses"""
         self.logger.info("Starting cache cleanup")
         try:
-            import shutil
             if self.cache_dir.exists():
-                # Remove all .json files in cache directory
-                cache_files = list(self.cache_dir.glob("*.json"))
+                # Remove all cache files (.json, and .json.zst from the shared CacheManager)
+                cache_files = [f for suffix in CACHE_FILE_SUFFIXES
+                               for f in self.cache_dir.glob(f"*{suffix}")]
                 deleted_count = 0
                 for cache_file in cache_files:
                     try:
@@ -448,7 +473,8 @@ class ResumeProcessor:
             }
         
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
+            cache_files = [f for suffix in CACHE_FILE_SUFFIXES
+                           for f in self.cache_dir.glob(f"*{suffix}")]
             total_size = sum(f.stat().st_size for f in cache_files if f.is_file())
             
             self.logger.debug(f"Found {len(cache_files)} cache files, total size: {total_size} bytes")
@@ -459,15 +485,14 @@ class ResumeProcessor:
             
             for cache_file in cache_files:
                 try:
-                    # Read the cache file to get timestamp and check if expired
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        cache_data = json.load(f)
+                    # Read the cache file (decompressing if needed) to get timestamp and check if expired
+                    cache_data = read_cache_file(cache_file)
                     
                     created_time = datetime.fromisoformat(cache_data.get('timestamp', ''))
                     is_expired = (datetime.now() - created_time).days > expiration_days
                     
                     cache_file_details.append({
-                        'key': cache_file.stem,  # filename without extension
+                        'key': cache_file.name.split('.', 1)[0],  # filename without extension(s)
                         'created': created_time.strftime('%Y-%m-%d %H:%M:%S'),
                         'size_kb': round(cache_file.stat().st_size / 1024, 2),
                         'is_expired': is_expired
@@ -476,7 +501,7 @@ class ResumeProcessor:
                     # If we can't read a cache file, just show basic info
                     self.logger.warning(f"Error reading cache file {cache_file}: {e}")
                     cache_file_details.append({
-                        'key': cache_file.stem,
+                        'key': cache_file.name.split('.', 1)[0],
                         'created': 'Unknown',
                         'size_kb': round(cache_file.stat().st_size / 1024, 2) if cache_file.exists() else 0,
                         'is_expired': False,
@@ -761,8 +786,7 @@ class ResumeProcessor:
                 self.logger.debug("Successfully parsed job analysis JSON response")
             except json.JSONDecodeError:
                 self.logger.warning("Initial JSON parsing failed, trying to extract from markdown code blocks")
-                import re
-                json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     analysis_results = json.loads(json_match.group(1))
                     self.logger.info("Successfully extracted JSON from markdown code blocks")
@@ -173,7 +173,7 @@ def export_config():
     
     try:
         config = get_config()
-        config_data = config.get_all_config()
+        config_data = dict(config.get_all_config())
         
         return jsonify({
             'success': True,
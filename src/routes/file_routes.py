@@ -4,6 +4,7 @@ Provides file download, listing, cleanup, and cache‐info endpoints via a Flask
 """
 
 import os
+from datetime import datetime
 from flask import Blueprint, render_template, request, jsonify, send_file, current_app, redirect, url_for, flash
 from werkzeug.utils import secure_filename
 from pathlib import Path
@@ -139,7 +140,6 @@ def cleanup_files():
         cleanup_type = data.get('type', 'all')  # 'uploads', 'results', or 'all'
         max_age_days = int(data.get('max_age_days', 7))
         
-        from datetime import datetime, timedelta
         cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 60 * 60)
         
         deleted_files = []
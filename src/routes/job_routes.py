@@ -15,6 +15,7 @@ import csv
 import json
 import uuid
 import threading
+import time
 from datetime import datetime
 from flask import Blueprint, request, jsonify, current_app
 from jobspy import scrape_jobs
@@ -550,7 +551,6 @@ def perform_job_search_with_progress(job_id, search_terms, desired_position, tar
         
         # Clean up after some time (in a real app, use a proper job queue)
         def cleanup_later():
-            import time
             time.sleep(300)  # Wait 5 minutes
             cleanup_job_progress(job_id)
         
@@ -610,7 +610,6 @@ def analyze_jobs_with_progress(job_id, processor, jobs_list, keywords, batch_siz
             analyzed_jobs.extend(processor._create_default_analysis(batch))
         
         # Small delay to make progress visible and be nice to APIs
-        import time
         time.sleep(0.1)
     
     # Final batch update
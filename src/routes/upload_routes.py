@@ -6,7 +6,7 @@ processing them via ResumeProcessor, and cleaning up on errors.
 """
 import os
 from datetime import datetime
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash
 from werkzeug.utils import secure_filename
 from resume_processor import ResumeProcessor
 import logging
@@ -84,8 +84,6 @@ def upload_resume():
           - `redirect(request.url)` if no file or empty filename.
           - `redirect(url_for('upload.index'))` on invalid type or processing error.
     """
-    from flask import current_app
-    
     logging.info("Resume upload request received")
     
     if 'resume' not in request.files:
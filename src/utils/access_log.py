@@ -0,0 +1,61 @@
+"""WSGI access logging middleware.
+
+This module provides a thin WSGI middleware that logs incoming requests and
+their response status codes straight from the WSGI environ, instead of going
+through Flask's before/after request hooks.
+"""
+import logging
+
+
+class AccessLogMiddleware:
+    """Log each request and its response status around a WSGI application.
+
+    Requests whose path starts with one of ``skip_prefixes`` (e.g. health
+    checks) are passed through without logging to reduce noise, as are all
+    requests while the logger is not enabled for INFO.
+
+    Args:
+        app (callable): The wrapped WSGI application (usually ``flask_app.wsgi_app``).
+        logger (logging.Logger): Logger used for the access log lines.
+        skip_prefixes (tuple, optional): Path prefixes excluded from logging.
+            Defaults to an empty tuple.
+
+    Example:
+        app.wsgi_app = AccessLogMiddleware(app.wsgi_app, logger, ('/health',))
+    """
+
+    def __init__(self, app, logger, skip_prefixes=()):
+        self.app = app
+        self.logger = logger
+        self.skip_prefixes = tuple(skip_prefixes)
+
+    def __call__(self, environ, start_response):
+        """Handle a WSGI request, logging it unless its path is skipped.
+
+        Args:
+            environ (dict): The WSGI environment.
+            start_response (callable): The WSGI ``start_response`` callable.
+
+        Returns:
+            iterable: The response body from the wrapped application.
+        """
+        # Check the level first so disabled logging skips the path matching too
+        if not self.logger.isEnabledFor(logging.INFO):
+            return self.app(environ, start_response)
+
+        path = environ.get('PATH_INFO', '')
+        if path.startswith(self.skip_prefixes):
+            return self.app(environ, start_response)
+
+        # Log path + query string read straight from the environ rather than
+        # rebuilding the full URL (scheme, host, root) as request.url does
+        query_string = environ.get('QUERY_STRING')
+        target = f"{path}?{query_string}" if query_string else path
+        method = environ.get('REQUEST_METHOD', '')
+        self.logger.info("Request: %s %s - Remote IP: %s", method, target, environ.get('REMOTE_ADDR'))
+
+        def logging_start_response(status, headers, exc_info=None):
+            self.logger.info("Response: %s for %s %s", status.split(' ', 1)[0], method, target)
+            return start_response(status, headers, exc_info)
+
+        return self.app(environ, logging_start_response)
@@ -0,0 +1,35 @@
+"""Shared OpenAI client for the resume processors.
+
+This module owns the single OpenAI client used by both ResumeProcessor
+implementations, so its HTTP connection pool is reused across instances and
+requests instead of being rebuilt for every processor.
+"""
+import threading
+from openai import OpenAI
+
+# Client shared process-wide, and the API key it was built with
+_client = None
+_client_api_key = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client(config) -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use.
+
+    The client is rebuilt only if the configured API key changes. Creation is
+    guarded by a lock so concurrent first callers build a single client.
+
+    Args:
+        config (ConfigLoader): Configuration providing the OpenAI API key.
+
+    Returns:
+        OpenAI: The shared client instance.
+    """
+    global _client, _client_api_key
+    api_key = config.get_openai_api_key()
+    if _client is None or _client_api_key != api_key:
+        with _client_lock:
+            if _client is None or _client_api_key != api_key:
+                _client = OpenAI(api_key=api_key)
+                _client_api_key = api_key
+    return _client
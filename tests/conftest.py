@@ -0,0 +1,7 @@
+"""Shared pytest setup: make the modules under src/ importable as top-level modules."""
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
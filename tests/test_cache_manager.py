@@ -0,0 +1,141 @@
+"""Tests for CacheManager: entry round trips, compression, expiry and cleanup."""
+import json
+import os
+import time
+
+import pytest
+
+import processors.cache_manager as cache_manager
+from config_loader import ConfigLoader
+from processors.cache_manager import (
+    CacheManager, COMPRESS_MIN_BYTES, SECONDS_PER_DAY, read_cache_file,
+)
+
+MB = 1024 * 1024
+
+# A response whose serialized entry is well past the compression threshold
+LARGE_RESPONSE = {'text': 'x' * (COMPRESS_MIN_BYTES * 2)}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return CacheManager(str(tmp_path / 'cache'))
+
+
+def _names(manager):
+    return sorted(os.listdir(manager.cache_dir))
+
+
+def test_small_entry_round_trips_as_json(manager):
+    manager.save_cached_response('abc', {'score': 85, 'tags': ['python']})
+
+    assert _names(manager) == ['abc.json']
+    entry = read_cache_file(manager.cache_dir / 'abc.json')
+    assert entry['response'] == {'score': 85, 'tags': ['python']}
+    assert isinstance(entry['created_at'], float) and entry['timestamp']
+    assert manager.get_cached_response('abc') == {'score': 85, 'tags': ['python']}
+
+
+def test_large_entry_round_trips_as_json_zst(manager):
+    pytest.importorskip('zstandard')
+    manager.save_cached_response('big', LARGE_RESPONSE)
+
+    assert _names(manager) == ['big.json.zst']
+    cache_file = manager.cache_dir / 'big.json.zst'
+    assert cache_file.stat().st_size < COMPRESS_MIN_BYTES
+    assert read_cache_file(cache_file)['response'] == LARGE_RESPONSE
+    assert manager.get_cached_response('big') == LARGE_RESPONSE
+
+
+def test_large_entry_stays_json_without_zstandard(manager, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'zstandard', None)
+    manager.save_cached_response('big', LARGE_RESPONSE)
+
+    assert _names(manager) == ['big.json']
+    assert manager.get_cached_response('big') == LARGE_RESPONSE
+
+
+def test_resave_removes_entry_under_other_suffix(manager):
+    """Growing past, or shrinking below, the threshold leaves one file per key."""
+    pytest.importorskip('zstandard')
+    manager.save_cached_response('k', {'text': 'small'})
+    manager.save_cached_response('k', LARGE_RESPONSE)
+    assert _names(manager) == ['k.json.zst']
+    assert manager.get_cached_response('k') == LARGE_RESPONSE
+
+    manager.save_cached_response('k', {'text': 'small again'})
+    assert _names(manager) == ['k.json']
+    assert manager.get_cached_response('k') == {'text': 'small again'}
+
+
+def test_miss_returns_empty_dict(manager):
+    assert manager.get_cached_response('missing') == {}
+
+
+@pytest.mark.parametrize('name, content', [
+    ('bad.json', b'{not json'),
+    ('bad.json.zst', b'not a zstd frame'),
+])
+def test_corrupted_entry_is_removed(manager, name, content):
+    (manager.cache_dir / name).write_bytes(content)
+
+    assert manager.get_cached_response('bad') == {}
+    assert not (manager.cache_dir / name).exists()
+
+
+def test_expired_entry_is_removed(manager):
+    expired_at = time.time() - (manager.config.get_cache_expiration_days() + 1) * SECONDS_PER_DAY
+    cache_file = manager.cache_dir / 'old.json'
+    cache_file.write_text(json.dumps({'created_at': expired_at, 'response': {'a': 1}}))
+
+    assert manager.get_cached_response('old') == {}
+    assert not cache_file.exists()
+
+
+def test_entry_with_only_iso_timestamp_is_read(manager):
+    """Entries written before created_at existed carry just the ISO timestamp."""
+    (manager.cache_dir / 'legacy.json').write_text(json.dumps({
+        'timestamp': '2999-01-01T00:00:00', 'response': {'a': 1},
+    }))
+    # A future timestamp is never expired
+    assert manager.get_cached_response('legacy') == {'a': 1}
+
+
+def _fill(manager):
+    """Write 1.5 MB of cache files of both kinds plus one unrelated file."""
+    (manager.cache_dir / 'a.json').write_bytes(b'0' * MB)
+    (manager.cache_dir / 'b.json.zst').write_bytes(b'0' * (MB // 2))
+    (manager.cache_dir / 'notes.txt').write_bytes(b'keep me')
+
+
+def test_cache_info_counts_both_suffixes(manager):
+    _fill(manager)
+    os.utime(manager.cache_dir / 'a.json', (1, 1))
+
+    info = manager.get_cache_info()
+    assert info['cache_files_count'] == 2
+    assert info['total_size_mb'] == 1.5
+    # Newest first
+    assert [f['name'] for f in info['files']] == ['b.json.zst', 'a.json']
+    assert info['files'][1]['size_bytes'] == MB
+
+
+def test_clear_cache_removes_only_cache_files(manager):
+    _fill(manager)
+
+    assert manager.clear_cache() == {'files_removed': 2, 'space_freed_mb': 1.5}
+    assert _names(manager) == ['notes.txt']
+
+
+def test_clear_cache_exclusive_dir_recreates_directory(manager, monkeypatch):
+    monkeypatch.setattr(ConfigLoader, 'get_cache_exclusive_dir', lambda self: True)
+    _fill(manager)
+
+    assert manager.clear_cache() == {'files_removed': 2, 'space_freed_mb': 1.5}
+    assert manager.cache_dir.is_dir()
+    assert _names(manager) == []
+
+
+def test_clear_cache_missing_directory(manager):
+    manager.cache_dir.rmdir()
+    assert manager.clear_cache() == {'files_removed': 0, 'space_freed_mb': 0}
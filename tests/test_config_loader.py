@@ -0,0 +1,168 @@
+"""Tests for ConfigLoader: the JSON sidecar cache, env substitution and saving."""
+import json
+import os
+
+import pytest
+
+from config_loader import ConfigLoader, _CONFIG_CACHE_VERSION
+
+CONFIG_YAML = """\
+app:
+  port: 5000
+  name: seekr
+openai:
+  model: ${TEST_SEEKR_MODEL:-gpt-default}
+cache:
+  redis_url: redis://$TEST_SEEKR_HOST:6379/0
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """A config.yaml in a temporary directory, with the test env vars unset."""
+    monkeypatch.delenv('TEST_SEEKR_MODEL', raising=False)
+    monkeypatch.delenv('TEST_SEEKR_HOST', raising=False)
+    path = tmp_path / 'config.yaml'
+    path.write_text(CONFIG_YAML, encoding='utf-8')
+    return path
+
+
+def _sidecar(config_file):
+    return config_file.with_suffix('.yaml.cache.json')
+
+
+def _stat_key(path):
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def test_first_load_writes_versioned_sidecar(config_file):
+    """A cold load parses the YAML and caches the raw tree keyed by mtime and size."""
+    loader = ConfigLoader(str(config_file))
+    assert loader.get('app.port') == 5000
+
+    cached = json.loads(_sidecar(config_file).read_text(encoding='utf-8'))
+    assert cached['version'] == _CONFIG_CACHE_VERSION
+    assert cached['stat_key'] == _stat_key(config_file)
+    # Raw values are cached, so env vars are substituted on every load
+    assert cached['config']['openai']['model'] == '${TEST_SEEKR_MODEL:-gpt-default}'
+    assert not list(config_file.parent.glob('*.tmp'))
+
+
+def test_warm_load_reads_sidecar(config_file):
+    """A sidecar matching the YAML's stat is used instead of parsing the YAML."""
+    ConfigLoader(str(config_file)).get('app.port')
+    sidecar = _sidecar(config_file)
+    cached = json.loads(sidecar.read_text(encoding='utf-8'))
+    cached['config']['app']['port'] = 6001
+    sidecar.write_text(json.dumps(cached), encoding='utf-8')
+
+    assert ConfigLoader(str(config_file)).get('app.port') == 6001
+
+
+def test_sidecar_invalidated_by_mtime_change(config_file):
+    """Same size, different mtime: the YAML is parsed again."""
+    ConfigLoader(str(config_file)).get('app.port')
+    st = config_file.stat()
+    config_file.write_text(CONFIG_YAML.replace('5000', '5001'), encoding='utf-8')
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert config_file.stat().st_size == st.st_size
+
+    assert ConfigLoader(str(config_file)).get('app.port') == 5001
+    assert json.loads(_sidecar(config_file).read_text())['stat_key'] == _stat_key(config_file)
+
+
+def test_sidecar_invalidated_by_size_change(config_file):
+    """Same mtime, different size: the YAML is parsed again."""
+    ConfigLoader(str(config_file)).get('app.port')
+    st = config_file.stat()
+    config_file.write_text(CONFIG_YAML.replace('5000', '50000'), encoding='utf-8')
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert config_file.stat().st_mtime_ns == st.st_mtime_ns
+
+    assert ConfigLoader(str(config_file)).get('app.port') == 50000
+
+
+def test_sidecar_without_current_version_is_ignored(config_file):
+    """Sidecars written by older code are not trusted even when the stat matches."""
+    _sidecar(config_file).write_text(json.dumps({
+        'stat_key': _stat_key(config_file),
+        'config': {'app': {'port': 1}},
+    }), encoding='utf-8')
+
+    assert ConfigLoader(str(config_file)).get('app.port') == 5000
+
+
+def test_tree_that_does_not_round_trip_is_not_cached(tmp_path):
+    """Non-string keys would come back as strings from JSON, so no sidecar is written."""
+    path = tmp_path / 'config.yaml'
+    path.write_text('codes:\n  1: one\n  2: two\n', encoding='utf-8')
+
+    assert ConfigLoader(str(path)).get_dict('codes') == {1: 'one', 2: 'two'}
+    assert not _sidecar(path).exists()
+    assert ConfigLoader(str(path)).get_dict('codes') == {1: 'one', 2: 'two'}
+
+
+def test_env_substitution(config_file, monkeypatch):
+    """${VAR:-default} and $VAR references resolve from the environment."""
+    loader = ConfigLoader(str(config_file))
+    assert loader.get('openai.model') == 'gpt-default'
+    assert loader.get('cache.redis_url') == 'redis://:6379/0'
+
+    monkeypatch.setenv('TEST_SEEKR_MODEL', 'gpt-4o')
+    monkeypatch.setenv('TEST_SEEKR_HOST', 'redis')
+    loader = ConfigLoader(str(config_file))
+    assert loader.get('openai.model') == 'gpt-4o'
+    assert loader.get('cache.redis_url') == 'redis://redis:6379/0'
+
+
+def test_env_changes_need_refresh_env(config_file, monkeypatch):
+    """Overrides come from a snapshot, updated by refresh_env() and reload()."""
+    loader = ConfigLoader(str(config_file))
+    monkeypatch.setenv('TEST_SEEKR_PORT', '7000')
+    assert loader.get('app.port', env_override='TEST_SEEKR_PORT') == 5000
+
+    loader.refresh_env()
+    assert loader.get('app.port', env_override='TEST_SEEKR_PORT') == 7000
+
+    monkeypatch.setenv('TEST_SEEKR_MODEL', 'gpt-4o')
+    loader.reload()
+    assert loader.get('openai.model') == 'gpt-4o'
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('true', True), ('OFF', False), ('12', 12), ('-3', -3), ('1.5', 1.5),
+    ('abc', 'abc'), ('-', '-'),
+])
+def test_env_value_conversion(config_file, raw, expected):
+    assert ConfigLoader(str(config_file))._convert_env_value(raw) == expected
+
+
+def test_overlong_integer_env_value_stays_a_string(config_file, monkeypatch):
+    """Values past int()'s digit limit must not break construction."""
+    monkeypatch.setenv('TEST_SEEKR_BIG', '9' * 5000)
+    loader = ConfigLoader(str(config_file))
+    assert loader.get('app.port', env_override='TEST_SEEKR_BIG') == '9' * 5000
+
+
+def test_save_config_replaces_file_and_keeps_backup(config_file):
+    """save_config writes the new tree atomically and backs up the old file."""
+    loader = ConfigLoader(str(config_file))
+    loader.set('app.port', 8080)
+    loader.save_config()
+
+    backup = config_file.with_suffix('.yaml.backup')
+    assert backup.read_text(encoding='utf-8') == CONFIG_YAML
+    assert ConfigLoader(str(config_file)).get('app.port') == 8080
+    assert not config_file.with_suffix('.yaml.tmp').exists()
+
+
+def test_failed_save_leaves_config_untouched(config_file):
+    """A save that cannot serialize the tree raises and removes its temp file."""
+    loader = ConfigLoader(str(config_file))
+    loader.set('app.port', object())
+
+    with pytest.raises(RuntimeError):
+        loader.save_config()
+    assert config_file.read_text(encoding='utf-8') == CONFIG_YAML
+    assert not config_file.with_suffix('.yaml.tmp').exists()
@@ -0,0 +1,129 @@
+"""Tests for FileReader: PDF backend selection and fallback, TXT decoding."""
+import types
+
+import pytest
+
+import processors.file_reader as file_reader
+from processors.file_reader import FileReader
+
+PAGE_TEXTS = ['Jane Candidate Senior Engineer', 'Python Distributed Systems']
+
+
+def _write_pdf(path, page_texts):
+    """Write a minimal valid PDF with one line of Helvetica text per page."""
+    objects = {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        3: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    }
+    kids = []
+    for index, text in enumerate(page_texts):
+        page_id, content_id = 4 + 2 * index, 5 + 2 * index
+        kids.append(f'{page_id} 0 R')
+        stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'.encode('ascii')
+        objects[page_id] = (
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>'
+        ).encode('ascii')
+        objects[content_id] = b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream)
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode('ascii')
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b'%d 0 obj\n%s\nendobj\n' % (obj_id, objects[obj_id])
+    xref_offset = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for obj_id in sorted(objects):
+        out += b'%010d 00000 n \n' % offsets[obj_id]
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objects) + 1, xref_offset)
+    path.write_bytes(bytes(out))
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / 'resume.pdf'
+    _write_pdf(path, PAGE_TEXTS)
+    return path
+
+
+def _assert_pages(content):
+    for text in PAGE_TEXTS:
+        assert text in content
+    assert content.index(PAGE_TEXTS[0]) < content.index(PAGE_TEXTS[1])
+
+
+def test_pdf_uses_pypdf_without_pymupdf(pdf_file, monkeypatch):
+    """PyMuPDF is an opt-in extra; without it pypdf extracts the text."""
+    monkeypatch.setattr(file_reader, 'pymupdf', None)
+    _assert_pages(FileReader().read_resume_file(str(pdf_file)))
+
+
+def test_pdf_falls_back_to_pypdf_when_pymupdf_rejects_file(pdf_file, monkeypatch):
+    class FileDataError(Exception):
+        pass
+
+    def reject(path):
+        raise FileDataError(f'cannot open {path}')
+
+    monkeypatch.setattr(file_reader, 'pymupdf',
+                        types.SimpleNamespace(FileDataError=FileDataError, open=reject))
+    _assert_pages(FileReader().read_resume_file(str(pdf_file)))
+
+
+def test_pdf_uses_pymupdf_when_installed(pdf_file, monkeypatch):
+    pymupdf = pytest.importorskip('pymupdf')
+    monkeypatch.setattr(file_reader, 'pymupdf', pymupdf)
+    monkeypatch.setattr(FileReader, '_extract_pdf_pages_pypdf',
+                        lambda self, path: pytest.fail('pypdf should not be used'))
+    _assert_pages(FileReader().read_resume_file(str(pdf_file)))
+
+
+def test_pdf_without_text_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_reader, 'pymupdf', None)
+    path = tmp_path / 'blank.pdf'
+    _write_pdf(path, [''])
+    with pytest.raises(ValueError, match='no extractable text'):
+        FileReader().read_resume_file(str(path))
+
+
+def test_short_pdf_is_extracted_serially(monkeypatch):
+    monkeypatch.setattr(file_reader.os, 'cpu_count', lambda: 8)
+    monkeypatch.setattr(file_reader, '_start_method', lambda: 'fork')
+    reader = FileReader()
+    assert reader._extract_pages_parallel('unused.pdf', file_reader.PARALLEL_PDF_MIN_PAGES - 1) is None
+
+
+def test_spawned_workers_are_never_used(monkeypatch):
+    monkeypatch.setattr(file_reader.os, 'cpu_count', lambda: 8)
+    monkeypatch.setattr(file_reader, '_start_method', lambda: 'spawn')
+    reader = FileReader()
+    assert reader._extract_pages_parallel('unused.pdf', 10 * file_reader.PARALLEL_PDF_MIN_PAGES) is None
+
+
+def test_txt_reads_utf8(tmp_path):
+    path = tmp_path / 'resume.txt'
+    path.write_text('Café résumé\nline two\n', encoding='utf-8')
+    assert FileReader().read_resume_file(str(path)) == 'Café résumé\nline two\n'
+
+
+def test_txt_falls_back_to_latin1(tmp_path):
+    path = tmp_path / 'resume.txt'
+    path.write_bytes('Café résumé'.encode('latin-1'))
+    assert FileReader().read_resume_file(str(path)) == 'Café résumé'
+
+
+def test_extracted_text_cache_reuses_and_invalidates(pdf_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(file_reader, 'pymupdf', None)
+    reader = FileReader(cache_dir=str(tmp_path / 'text-cache'))
+    first = reader.read_resume_file(str(pdf_file))
+
+    monkeypatch.setattr(FileReader, '_read_pdf_file',
+                        lambda self, path: pytest.fail('cached text should be reused'))
+    assert reader.read_resume_file(str(pdf_file)) == first
+
+    monkeypatch.undo()
+    monkeypatch.setattr(file_reader, 'pymupdf', None)
+    _write_pdf(pdf_file, ['Changed Content Entirely'])
+    assert 'Changed Content Entirely' in reader.read_resume_file(str(pdf_file))